@@ -10,7 +10,6 @@ Namespace: http://www.anl.gov/sss/grid-stix-2.1-assets.owl
 from __future__ import annotations
 
 from typing import Optional, Any, List, Dict
-from collections import OrderedDict
 
 from stix2.properties import (  # type: ignore[import-untyped]
     StringProperty,
@@ -25,6 +24,8 @@ from stix2.properties import (  # type: ignore[import-untyped]
 )
 from stix2.utils import NOW  # type: ignore[import-untyped]
 
+from ..base import DeterministicUUIDGenerator
+
 
 # External imports
 
@@ -41,48 +42,35 @@ class ElectronicSecurityPerimeter(GridSTIXDomainObject):
     _type = "x-grid-electronic-security-perimeter"
 
     # STIX properties definition following official STIX patterns
-    _properties = OrderedDict(
-        [
-            ("type", TypeProperty(_type, spec_version="2.1")),
-            ("spec_version", StringProperty(fixed="2.1")),
-            ("id", IDProperty(_type, spec_version="2.1")),
-            (
-                "created",
-                TimestampProperty(
-                    default=lambda: NOW,
-                    precision="millisecond",
-                    precision_constraint="min",
-                ),
-            ),
-            (
-                "modified",
-                TimestampProperty(
-                    default=lambda: NOW,
-                    precision="millisecond",
-                    precision_constraint="min",
-                ),
-            ),
-            ("name", StringProperty()),
-            ("description", StringProperty()),
-            # Grid-STIX base properties
-            ("x_grid_context", DictionaryProperty()),
-            ("x_operational_status", StringProperty()),
-            ("x_compliance_framework", ListProperty(StringProperty)),
-            ("x_grid_component_type", StringProperty()),
-            ("x_criticality_level", IntegerProperty()),
-        ]
-    )
+    _properties = {
+        "type": TypeProperty(_type, spec_version="2.1"),
+        "spec_version": StringProperty(fixed="2.1"),
+        "id": IDProperty(_type, spec_version="2.1"),
+        "created": TimestampProperty(
+            default=lambda: NOW,
+            precision="millisecond",
+            precision_constraint="min",
+        ),
+        "modified": TimestampProperty(
+            default=lambda: NOW,
+            precision="millisecond",
+            precision_constraint="min",
+        ),
+        "name": StringProperty(),
+        "description": StringProperty(),
+        # Grid-STIX base properties
+        "x_grid_context": DictionaryProperty(),
+        "x_operational_status": StringProperty(),
+        "x_compliance_framework": ListProperty(StringProperty),
+        "x_grid_component_type": StringProperty(),
+        "x_criticality_level": IntegerProperty(),
+    }
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize ElectronicSecurityPerimeter with Grid-STIX properties."""
-        # Set STIX type if not provided
-        if "type" not in kwargs:
-            kwargs["type"] = self._type
-
+        # "type" is filled in by the fixed TypeProperty default
         # Generate deterministic ID if not provided
         if "id" not in kwargs:
-            from ..base import DeterministicUUIDGenerator
-
             # Generate deterministic UUID - will raise ValueError if required properties missing
             kwargs["id"] = DeterministicUUIDGenerator.generate_uuid(self._type, kwargs)
 
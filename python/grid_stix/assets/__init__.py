@@ -3,65 +3,82 @@ grid_stix.assets - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .ControlCenter import ControlCenter
-
-
-from .DistributionLine import DistributionLine
-
-
-from .ElectronicSecurityPerimeter import ElectronicSecurityPerimeter
-
-
-from .Generator import Generator
-
 
-from .GridComponent import GridComponent
-
-
-from .OTDevice import OTDevice
-
-
-from .OperationalGridEntity import OperationalGridEntity
-
-
-from .PhysicalAsset import PhysicalAsset
-
-
-from .PhysicalGridAsset import PhysicalGridAsset
-
-
-from .PhysicalSecurityPerimeter import PhysicalSecurityPerimeter
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
+import importlib
+import sys
+import types
+from typing import Any, List
 
-from .SecurityZone import SecurityZone
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "ControlCenter": ".ControlCenter",
+    "DistributionLine": ".DistributionLine",
+    "ElectronicSecurityPerimeter": ".ElectronicSecurityPerimeter",
+    "Generator": ".Generator",
+    "GridComponent": ".GridComponent",
+    "OTDevice": ".OTDevice",
+    "OperationalGridEntity": ".OperationalGridEntity",
+    "PhysicalAsset": ".PhysicalAsset",
+    "PhysicalGridAsset": ".PhysicalGridAsset",
+    "PhysicalSecurityPerimeter": ".PhysicalSecurityPerimeter",
+    "SecurityZone": ".SecurityZone",
+    "Substation": ".Substation",
+    "Supplier": ".Supplier",
+    "SupplyChainRisk": ".SupplyChainRisk",
+    "Transformer": ".Transformer",
+    "TransmissionLine": ".TransmissionLine",
+}
 
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = ("GridComponent",)
 
-from .Substation import Substation
 
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
-from .Supplier import Supplier
 
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .SupplyChainRisk import SupplyChainRisk
 
+sys.modules[__name__].__class__ = _LazyModule
 
-from .Transformer import Transformer
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-from .TransmissionLine import TransmissionLine
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Resolve forward references
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-# Only call model_rebuild() if the class has this method (Pydantic models)
-if hasattr(GridComponent, "model_rebuild"):
-    GridComponent.model_rebuild()
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -82,4 +99,5 @@ __all__ = [
     "SupplyChainRisk",
     "Transformer",
     "TransmissionLine",
+    "preload",
 ]
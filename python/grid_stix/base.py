@@ -12,8 +12,6 @@ from uuid import uuid4, uuid5, UUID
 import hashlib
 import json
 
-from collections import OrderedDict
-
 from stix2.v21 import _DomainObject, _RelationshipObject, _Observable  # type: ignore[import-untyped]
 from stix2.properties import (  # type: ignore[import-untyped]
     StringProperty,
@@ -808,15 +806,13 @@ class GridSTIXDomainObject(_DomainObject):  # type: ignore[misc]
 
     # Base properties that all Grid-STIX domain objects should have
     # Concrete classes will extend this with their own _type and specific properties
-    _base_properties = OrderedDict(
-        [
-            ("x_grid_context", DictionaryProperty()),
-            ("x_operational_status", StringProperty()),
-            ("x_compliance_framework", ListProperty(StringProperty)),
-            ("x_grid_component_type", StringProperty()),
-            ("x_criticality_level", IntegerProperty()),
-        ]
-    )
+    _base_properties = {
+        "x_grid_context": DictionaryProperty(),
+        "x_operational_status": StringProperty(),
+        "x_compliance_framework": ListProperty(StringProperty),
+        "x_grid_component_type": StringProperty(),
+        "x_criticality_level": IntegerProperty(),
+    }
 
 
 class GridSTIXRelationshipObject(_RelationshipObject):  # type: ignore[misc]
@@ -828,14 +824,12 @@ class GridSTIXRelationshipObject(_RelationshipObject):  # type: ignore[misc]
     """
 
     # Base properties that all Grid-STIX relationship objects should have
-    _base_properties = OrderedDict(
-        [
-            ("x_grid_relationship_context", DictionaryProperty()),
-            ("x_physical_connection", BooleanProperty()),
-            ("x_logical_connection", BooleanProperty()),
-            ("x_power_flow_direction", StringProperty()),
-        ]
-    )
+    _base_properties = {
+        "x_grid_relationship_context": DictionaryProperty(),
+        "x_physical_connection": BooleanProperty(),
+        "x_logical_connection": BooleanProperty(),
+        "x_power_flow_direction": StringProperty(),
+    }
 
 
 class GridSTIXObservableObject(_Observable):  # type: ignore[misc]
@@ -847,11 +841,9 @@ class GridSTIXObservableObject(_Observable):  # type: ignore[misc]
     """
 
     # Base properties that all Grid-STIX observable objects should have
-    _base_properties = OrderedDict(
-        [
-            ("x_grid_measurement_type", StringProperty()),
-            ("x_sensor_location", StringProperty()),
-            ("x_measurement_unit", StringProperty()),
-            ("x_sampling_rate", FloatProperty()),
-        ]
-    )
+    _base_properties = {
+        "x_grid_measurement_type": StringProperty(),
+        "x_sensor_location": StringProperty(),
+        "x_measurement_unit": StringProperty(),
+        "x_sampling_rate": FloatProperty(),
+    }
@@ -3,180 +3,121 @@ grid_stix.components - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .AdvancedMeteringNetwork import AdvancedMeteringNetwork
-
-
-from .AmiHeadEndSystem import AmiHeadEndSystem
-
-
-from .BatteryEnergyStorageSystem import BatteryEnergyStorageSystem
-
-
-from .CentralizedGenerationFacility import CentralizedGenerationFacility
-
-
-from .ChargingConnector import ChargingConnector
-
-
-from .DerCommunicationInterface import DerCommunicationInterface
-
-
-from .DerController import DerController
-
-
-from .DerDevice import DerDevice
-
-
-from .DerFirmware import DerFirmware
-
-
-from .DerNetworkInterface import DerNetworkInterface
-
-
-from .DerOperator import DerOperator
-
-
-from .DerOwner import DerOwner
-
-
-from .DerScada import DerScada
-
-
-from .DerSystem import DerSystem
-
-
-from .DerUser import DerUser
-
-
-from .Derms import Derms
-
-
-from .DistributedEnergyResource import DistributedEnergyResource
-
-
-from .DistributionAsset import DistributionAsset
-
-
-from .DistributionManagementSystem import DistributionManagementSystem
-
-
-from .EdgeIntelligentDevice import EdgeIntelligentDevice
-
-
-from .ElectricVehicle import ElectricVehicle
-
-
-from .ElectricVehicleSupplyEquipment import ElectricVehicleSupplyEquipment
-
-
-from .EnergyMeterEvse import EnergyMeterEvse
-
-
-from .EvseController import EvseController
-
 
-from .FacilityEnergyManagementSystem import FacilityEnergyManagementSystem
-
-
-from .FossilFuelPlant import FossilFuelPlant
-
-
-from .FuelCell import FuelCell
-
-
-from .GenerationAsset import GenerationAsset
-
-
-from .HumanMachineInterface import HumanMachineInterface
-
-
-from .Ieee1815Dnp3 import Ieee1815Dnp3
-
-
-from .Ieee20305 import Ieee20305
-
-
-from .InterconnectionDevice import InterconnectionDevice
-
-
-from .Inverter import Inverter
-
-
-from .Iso15118Protocol import Iso15118Protocol
-
-
-from .LocalElectricPowerSystem import LocalElectricPowerSystem
-
-
-from .MaintenancePort import MaintenancePort
-
-
-from .MeshNetworkGateway import MeshNetworkGateway
-
-
-from .MeterDataManagementSystem import MeterDataManagementSystem
-
-
-from .Microgrid import Microgrid
-
-
-from .NuclearPowerPlant import NuclearPowerPlant
-
-
-from .OcppProtocol import OcppProtocol
-
-
-from .PhotovoltaicSystem import PhotovoltaicSystem
-
-
-from .PointOfCommonCoupling import PointOfCommonCoupling
-
-
-from .RenewableGenerationFacility import RenewableGenerationFacility
-
-
-from .Sensor import Sensor
-
-
-from .SensorInputs import SensorInputs
-
-
-from .SmartInverter import SmartInverter
-
-
-from .SmartMeter import SmartMeter
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
+import importlib
+import sys
+import types
+from typing import Any, List
+
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "AdvancedMeteringNetwork": ".AdvancedMeteringNetwork",
+    "AmiHeadEndSystem": ".AmiHeadEndSystem",
+    "BatteryEnergyStorageSystem": ".BatteryEnergyStorageSystem",
+    "CentralizedGenerationFacility": ".CentralizedGenerationFacility",
+    "ChargingConnector": ".ChargingConnector",
+    "DerCommunicationInterface": ".DerCommunicationInterface",
+    "DerController": ".DerController",
+    "DerDevice": ".DerDevice",
+    "DerFirmware": ".DerFirmware",
+    "DerNetworkInterface": ".DerNetworkInterface",
+    "DerOperator": ".DerOperator",
+    "DerOwner": ".DerOwner",
+    "DerScada": ".DerScada",
+    "DerSystem": ".DerSystem",
+    "DerUser": ".DerUser",
+    "Derms": ".Derms",
+    "DistributedEnergyResource": ".DistributedEnergyResource",
+    "DistributionAsset": ".DistributionAsset",
+    "DistributionManagementSystem": ".DistributionManagementSystem",
+    "EdgeIntelligentDevice": ".EdgeIntelligentDevice",
+    "ElectricVehicle": ".ElectricVehicle",
+    "ElectricVehicleSupplyEquipment": ".ElectricVehicleSupplyEquipment",
+    "EnergyMeterEvse": ".EnergyMeterEvse",
+    "EvseController": ".EvseController",
+    "FacilityEnergyManagementSystem": ".FacilityEnergyManagementSystem",
+    "FossilFuelPlant": ".FossilFuelPlant",
+    "FuelCell": ".FuelCell",
+    "GenerationAsset": ".GenerationAsset",
+    "HumanMachineInterface": ".HumanMachineInterface",
+    "Ieee1815Dnp3": ".Ieee1815Dnp3",
+    "Ieee20305": ".Ieee20305",
+    "InterconnectionDevice": ".InterconnectionDevice",
+    "Inverter": ".Inverter",
+    "Iso15118Protocol": ".Iso15118Protocol",
+    "LocalElectricPowerSystem": ".LocalElectricPowerSystem",
+    "MaintenancePort": ".MaintenancePort",
+    "MeshNetworkGateway": ".MeshNetworkGateway",
+    "MeterDataManagementSystem": ".MeterDataManagementSystem",
+    "Microgrid": ".Microgrid",
+    "NuclearPowerPlant": ".NuclearPowerPlant",
+    "OcppProtocol": ".OcppProtocol",
+    "PhotovoltaicSystem": ".PhotovoltaicSystem",
+    "PointOfCommonCoupling": ".PointOfCommonCoupling",
+    "RenewableGenerationFacility": ".RenewableGenerationFacility",
+    "Sensor": ".Sensor",
+    "SensorInputs": ".SensorInputs",
+    "SmartInverter": ".SmartInverter",
+    "SmartMeter": ".SmartMeter",
+    "SunspecModbusTcp": ".SunspecModbusTcp",
+    "V2gCommunicationModule": ".V2gCommunicationModule",
+    "WindTurbine": ".WindTurbine",
+}
+
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = (
+    "DerDevice",
+    "DerCommunicationInterface",
+    "DerOwner",
+)
 
-from .SunspecModbusTcp import SunspecModbusTcp
 
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
-from .V2gCommunicationModule import V2gCommunicationModule
 
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .WindTurbine import WindTurbine
 
+sys.modules[__name__].__class__ = _LazyModule
 
-# Resolve forward references
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-# Only call model_rebuild() if the class has this method (Pydantic models)
-if hasattr(DerDevice, "model_rebuild"):
-    DerDevice.model_rebuild()
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Only call model_rebuild() if the class has this method (Pydantic models)
-if hasattr(DerCommunicationInterface, "model_rebuild"):
-    DerCommunicationInterface.model_rebuild()
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-# Only call model_rebuild() if the class has this method (Pydantic models)
-if hasattr(DerOwner, "model_rebuild"):
-    DerOwner.model_rebuild()
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -232,4 +173,5 @@ __all__ = [
     "SunspecModbusTcp",
     "V2gCommunicationModule",
     "WindTurbine",
+    "preload",
 ]
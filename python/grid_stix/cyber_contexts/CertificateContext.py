@@ -10,7 +10,6 @@ Namespace: http://www.anl.gov/sss/grid-stix-2.1-cyber-contexts.owl
 from __future__ import annotations
 
 from typing import Optional, Any, List, Dict
-from collections import OrderedDict
 
 from stix2.properties import (  # type: ignore[import-untyped]
     StringProperty,
@@ -25,6 +24,8 @@ from stix2.properties import (  # type: ignore[import-untyped]
 )
 from stix2.utils import NOW  # type: ignore[import-untyped]
 
+from ..base import DeterministicUUIDGenerator
+
 
 # External imports
 
@@ -41,58 +42,45 @@ class CertificateContext(GridSTIXDomainObject):
     _type = "x-grid-certificate-context"
 
     # STIX properties definition following official STIX patterns
-    _properties = OrderedDict(
-        [
-            ("type", TypeProperty(_type, spec_version="2.1")),
-            ("spec_version", StringProperty(fixed="2.1")),
-            ("id", IDProperty(_type, spec_version="2.1")),
-            (
-                "created",
-                TimestampProperty(
-                    default=lambda: NOW,
-                    precision="millisecond",
-                    precision_constraint="min",
-                ),
-            ),
-            (
-                "modified",
-                TimestampProperty(
-                    default=lambda: NOW,
-                    precision="millisecond",
-                    precision_constraint="min",
-                ),
-            ),
-            ("name", StringProperty()),
-            ("description", StringProperty()),
-            # Grid-STIX base properties
-            ("x_grid_context", DictionaryProperty()),
-            ("x_operational_status", StringProperty()),
-            ("x_compliance_framework", ListProperty(StringProperty)),
-            ("x_grid_component_type", StringProperty()),
-            ("x_criticality_level", IntegerProperty()),
-            ("x_certificate_id", ListProperty(StringProperty())),
-            ("x_certificate_purpose", ListProperty(StringProperty())),
-            ("x_certificate_status", ListProperty(StringProperty())),
-            ("x_certificate_type", ListProperty(StringProperty())),
-            ("x_issuer_authority", ListProperty(StringProperty())),
-            ("x_last_validation_check", ListProperty(StringProperty())),
-            ("x_revocation_reason", ListProperty(StringProperty())),
-            ("x_trust_chain_valid", ListProperty(BooleanProperty())),
-            ("x_validity_period_end", ListProperty(StringProperty())),
-            ("x_validity_period_start", ListProperty(StringProperty())),
-        ]
-    )
+    _properties = {
+        "type": TypeProperty(_type, spec_version="2.1"),
+        "spec_version": StringProperty(fixed="2.1"),
+        "id": IDProperty(_type, spec_version="2.1"),
+        "created": TimestampProperty(
+            default=lambda: NOW,
+            precision="millisecond",
+            precision_constraint="min",
+        ),
+        "modified": TimestampProperty(
+            default=lambda: NOW,
+            precision="millisecond",
+            precision_constraint="min",
+        ),
+        "name": StringProperty(),
+        "description": StringProperty(),
+        # Grid-STIX base properties
+        "x_grid_context": DictionaryProperty(),
+        "x_operational_status": StringProperty(),
+        "x_compliance_framework": ListProperty(StringProperty),
+        "x_grid_component_type": StringProperty(),
+        "x_criticality_level": IntegerProperty(),
+        "x_certificate_id": ListProperty(StringProperty()),
+        "x_certificate_purpose": ListProperty(StringProperty()),
+        "x_certificate_status": ListProperty(StringProperty()),
+        "x_certificate_type": ListProperty(StringProperty()),
+        "x_issuer_authority": ListProperty(StringProperty()),
+        "x_last_validation_check": ListProperty(StringProperty()),
+        "x_revocation_reason": ListProperty(StringProperty()),
+        "x_trust_chain_valid": ListProperty(BooleanProperty()),
+        "x_validity_period_end": ListProperty(StringProperty()),
+        "x_validity_period_start": ListProperty(StringProperty()),
+    }
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize CertificateContext with Grid-STIX properties."""
-        # Set STIX type if not provided
-        if "type" not in kwargs:
-            kwargs["type"] = self._type
-
+        # "type" is filled in by the fixed TypeProperty default
         # Generate deterministic ID if not provided
         if "id" not in kwargs:
-            from ..base import DeterministicUUIDGenerator
-
             # Generate deterministic UUID - will raise ValueError if required properties missing
             kwargs["id"] = DeterministicUUIDGenerator.generate_uuid(self._type, kwargs)
 
@@ -3,60 +3,83 @@ grid_stix.cyber_contexts - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .ApiEndpoint import ApiEndpoint
-
-
-from .CertificateContext import CertificateContext
-
-
-from .CommunicationSession import CommunicationSession
-
-
-from .ContinuousMonitoringAgent import ContinuousMonitoringAgent
 
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
-from .CredentialContext import CredentialContext
-
-
-from .CybersecurityPosture import CybersecurityPosture
-
-
-from .DerAggregator import DerAggregator
-
-
-from .GridServiceContract import GridServiceContract
-
-
-from .IdentityVerificationService import IdentityVerificationService
-
+import importlib
+import sys
+import types
+from typing import Any, List
 
-from .IsolationPolicy import IsolationPolicy
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "ApiEndpoint": ".ApiEndpoint",
+    "CertificateContext": ".CertificateContext",
+    "CommunicationSession": ".CommunicationSession",
+    "ContinuousMonitoringAgent": ".ContinuousMonitoringAgent",
+    "CredentialContext": ".CredentialContext",
+    "CybersecurityPosture": ".CybersecurityPosture",
+    "DerAggregator": ".DerAggregator",
+    "GridServiceContract": ".GridServiceContract",
+    "IdentityVerificationService": ".IdentityVerificationService",
+    "IsolationPolicy": ".IsolationPolicy",
+    "NetworkSegment": ".NetworkSegment",
+    "PolicyDecisionContext": ".PolicyDecisionContext",
+    "PolicyDecisionPoint": ".PolicyDecisionPoint",
+    "PolicyEnforcementPoint": ".PolicyEnforcementPoint",
+    "RealTimeTrustAssessment": ".RealTimeTrustAssessment",
+    "RiskAssessment": ".RiskAssessment",
+    "TrustBroker": ".TrustBroker",
+}
 
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = ()
 
-from .NetworkSegment import NetworkSegment
 
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
-from .PolicyDecisionContext import PolicyDecisionContext
 
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .PolicyDecisionPoint import PolicyDecisionPoint
 
+sys.modules[__name__].__class__ = _LazyModule
 
-from .PolicyEnforcementPoint import PolicyEnforcementPoint
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-from .RealTimeTrustAssessment import RealTimeTrustAssessment
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .RiskAssessment import RiskAssessment
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-from .TrustBroker import TrustBroker
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -78,4 +101,5 @@ __all__ = [
     "RealTimeTrustAssessment",
     "RiskAssessment",
     "TrustBroker",
+    "preload",
 ]
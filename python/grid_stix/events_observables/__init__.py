@@ -3,53 +3,78 @@ grid_stix.events_observables - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .AlarmEvent import AlarmEvent
-
-
-from .AnomalyEvent import AnomalyEvent
-
 
-from .AuthenticationEvent import AuthenticationEvent
-
-
-from .ConfigurationEvent import ConfigurationEvent
-
-
-from .ControlActionEvent import ControlActionEvent
-
-
-from .FirmwareEvent import FirmwareEvent
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
+import importlib
+import sys
+import types
+from typing import Any, List
 
-from .GridEvent import GridEvent
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "AlarmEvent": ".AlarmEvent",
+    "AnomalyEvent": ".AnomalyEvent",
+    "AuthenticationEvent": ".AuthenticationEvent",
+    "ConfigurationEvent": ".ConfigurationEvent",
+    "ControlActionEvent": ".ControlActionEvent",
+    "FirmwareEvent": ".FirmwareEvent",
+    "GridEvent": ".GridEvent",
+    "GridProtocolTraffic": ".GridProtocolTraffic",
+    "GridTelemetry": ".GridTelemetry",
+    "MaintenanceEvent": ".MaintenanceEvent",
+    "PhysicalAccessEvent": ".PhysicalAccessEvent",
+    "StateChangeEvent": ".StateChangeEvent",
+}
 
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = ("GridEvent",)
 
-from .GridProtocolTraffic import GridProtocolTraffic
 
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
-from .GridTelemetry import GridTelemetry
 
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .MaintenanceEvent import MaintenanceEvent
 
+sys.modules[__name__].__class__ = _LazyModule
 
-from .PhysicalAccessEvent import PhysicalAccessEvent
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-from .StateChangeEvent import StateChangeEvent
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Resolve forward references
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-# Only call model_rebuild() if the class has this method (Pydantic models)
-if hasattr(GridEvent, "model_rebuild"):
-    GridEvent.model_rebuild()
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -66,4 +91,5 @@ __all__ = [
     "MaintenanceEvent",
     "PhysicalAccessEvent",
     "StateChangeEvent",
+    "preload",
 ]
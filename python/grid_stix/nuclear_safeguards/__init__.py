@@ -3,54 +3,81 @@ grid_stix.nuclear_safeguards - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .ContainmentSurveillanceSystem import ContainmentSurveillanceSystem
-
-
-from .EnrichmentFacility import EnrichmentFacility
-
-
-from .FuelFabricationFacility import FuelFabricationFacility
 
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
-from .KeyMeasurementPoint import KeyMeasurementPoint
-
-
-from .MaterialAccountingSystem import MaterialAccountingSystem
-
-
-from .MaterialBalanceArea import MaterialBalanceArea
-
-
-from .MaterialDiversionIndicator import MaterialDiversionIndicator
-
+import importlib
+import sys
+import types
+from typing import Any, List
 
-from .NuclearFacility import NuclearFacility
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "ContainmentSurveillanceSystem": ".ContainmentSurveillanceSystem",
+    "EnrichmentFacility": ".EnrichmentFacility",
+    "FuelFabricationFacility": ".FuelFabricationFacility",
+    "KeyMeasurementPoint": ".KeyMeasurementPoint",
+    "MaterialAccountingSystem": ".MaterialAccountingSystem",
+    "MaterialBalanceArea": ".MaterialBalanceArea",
+    "MaterialDiversionIndicator": ".MaterialDiversionIndicator",
+    "NuclearFacility": ".NuclearFacility",
+    "NuclearMaterial": ".NuclearMaterial",
+    "RadiationDetectionSystem": ".RadiationDetectionSystem",
+    "ReprocessingFacility": ".ReprocessingFacility",
+    "ResearchReactor": ".ResearchReactor",
+    "SafeguardsAnomaly": ".SafeguardsAnomaly",
+    "SafeguardsSystem": ".SafeguardsSystem",
+    "WasteStorageFacility": ".WasteStorageFacility",
+}
 
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = ()
 
-from .NuclearMaterial import NuclearMaterial
 
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
-from .RadiationDetectionSystem import RadiationDetectionSystem
 
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .ReprocessingFacility import ReprocessingFacility
 
+sys.modules[__name__].__class__ = _LazyModule
 
-from .ResearchReactor import ResearchReactor
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-from .SafeguardsAnomaly import SafeguardsAnomaly
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .SafeguardsSystem import SafeguardsSystem
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-from .WasteStorageFacility import WasteStorageFacility
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -70,4 +97,5 @@ __all__ = [
     "SafeguardsAnomaly",
     "SafeguardsSystem",
     "WasteStorageFacility",
+    "preload",
 ]
@@ -3,27 +3,72 @@ grid_stix.operational_contexts - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
+
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
 """
 
-# Import all classes from this module
+import importlib
+import sys
+import types
+from typing import Any, List
+
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "DerOperationalContext": ".DerOperationalContext",
+    "EmergencyResponseContext": ".EmergencyResponseContext",
+    "GridOperatingConditionContext": ".GridOperatingConditionContext",
+    "MaintenanceContext": ".MaintenanceContext",
+    "OperationalContext": ".OperationalContext",
+    "OutageContext": ".OutageContext",
+}
+
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = ()
+
 
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
-from .DerOperationalContext import DerOperationalContext
 
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .EmergencyResponseContext import EmergencyResponseContext
 
+sys.modules[__name__].__class__ = _LazyModule
 
-from .GridOperatingConditionContext import GridOperatingConditionContext
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-from .MaintenanceContext import MaintenanceContext
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .OperationalContext import OperationalContext
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-from .OutageContext import OutageContext
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -34,4 +79,5 @@ __all__ = [
     "MaintenanceContext",
     "OperationalContext",
     "OutageContext",
+    "preload",
 ]
@@ -3,42 +3,77 @@ grid_stix.policies - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .AccessPolicy import AccessPolicy
 
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
-from .AlertAction import AlertAction
-
-
-from .AllowAction import AllowAction
-
+import importlib
+import sys
+import types
+from typing import Any, List
 
-from .ConfigurationPolicy import ConfigurationPolicy
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "AccessPolicy": ".AccessPolicy",
+    "AlertAction": ".AlertAction",
+    "AllowAction": ".AllowAction",
+    "ConfigurationPolicy": ".ConfigurationPolicy",
+    "DenyAction": ".DenyAction",
+    "LogAction": ".LogAction",
+    "MonitoringPolicy": ".MonitoringPolicy",
+    "Policy": ".Policy",
+    "PolicyAction": ".PolicyAction",
+    "QuarantineAction": ".QuarantineAction",
+    "SecurityPolicy": ".SecurityPolicy",
+}
 
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = ()
 
-from .DenyAction import DenyAction
 
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
-from .LogAction import LogAction
 
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .MonitoringPolicy import MonitoringPolicy
 
+sys.modules[__name__].__class__ = _LazyModule
 
-from .Policy import Policy
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-from .PolicyAction import PolicyAction
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .QuarantineAction import QuarantineAction
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-from .SecurityPolicy import SecurityPolicy
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -54,4 +89,5 @@ __all__ = [
     "PolicyAction",
     "QuarantineAction",
     "SecurityPolicy",
+    "preload",
 ]
@@ -3,143 +3,108 @@ grid_stix.relationships - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .AffectsOperationOfRelationship import AffectsOperationOfRelationship
-
-
-from .AggregatesRelationship import AggregatesRelationship
-
-
-from .AuthenticatesToRelationship import AuthenticatesToRelationship
-
-
-from .AuthenticatesWithRelationship import AuthenticatesWithRelationship
-
-
-from .AuthorizesAccessToRelationship import AuthorizesAccessToRelationship
-
-
-from .CertifiedByRelationship import CertifiedByRelationship
-
-
-from .ConnectsToRelationship import ConnectsToRelationship
-
-
-from .ContainedInFacilityRelationship import ContainedInFacilityRelationship
-
-
-from .ContainsRelationship import ContainsRelationship
-
-
-from .ControlsRelationship import ControlsRelationship
-
-
-from .ConvertsForRelationship import ConvertsForRelationship
-
-
-from .DelegatesAuthorityToRelationship import DelegatesAuthorityToRelationship
-
-
-from .DependsOnRelationship import DependsOnRelationship
-
-
-from .EnforcesPolicyOnRelationship import EnforcesPolicyOnRelationship
-
-
-from .FeedsPowerToRelationship import FeedsPowerToRelationship
-
-
-from .FeedsRelationship import FeedsRelationship
-
-
-from .GeneratesPowerForRelationship import GeneratesPowerForRelationship
-
-
-from .GridRelationship import GridRelationship
-
-
-from .HasVulnerabilityRelationship import HasVulnerabilityRelationship
-
-
-from .IslandsFromRelationship import IslandsFromRelationship
-
-
-from .LocatedAtRelationship import LocatedAtRelationship
 
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
-from .MonitoredByEnvironmentalSensorRelationship import (
-    MonitoredByEnvironmentalSensorRelationship,
+import importlib
+import sys
+import types
+from typing import Any, List
+
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "AffectsOperationOfRelationship": ".AffectsOperationOfRelationship",
+    "AggregatesRelationship": ".AggregatesRelationship",
+    "AuthenticatesToRelationship": ".AuthenticatesToRelationship",
+    "AuthenticatesWithRelationship": ".AuthenticatesWithRelationship",
+    "AuthorizesAccessToRelationship": ".AuthorizesAccessToRelationship",
+    "CertifiedByRelationship": ".CertifiedByRelationship",
+    "ConnectsToRelationship": ".ConnectsToRelationship",
+    "ContainedInFacilityRelationship": ".ContainedInFacilityRelationship",
+    "ContainsRelationship": ".ContainsRelationship",
+    "ControlsRelationship": ".ControlsRelationship",
+    "ConvertsForRelationship": ".ConvertsForRelationship",
+    "DelegatesAuthorityToRelationship": ".DelegatesAuthorityToRelationship",
+    "DependsOnRelationship": ".DependsOnRelationship",
+    "EnforcesPolicyOnRelationship": ".EnforcesPolicyOnRelationship",
+    "FeedsPowerToRelationship": ".FeedsPowerToRelationship",
+    "FeedsRelationship": ".FeedsRelationship",
+    "GeneratesPowerForRelationship": ".GeneratesPowerForRelationship",
+    "GridRelationship": ".GridRelationship",
+    "HasVulnerabilityRelationship": ".HasVulnerabilityRelationship",
+    "IslandsFromRelationship": ".IslandsFromRelationship",
+    "LocatedAtRelationship": ".LocatedAtRelationship",
+    "MonitoredByEnvironmentalSensorRelationship": ".MonitoredByEnvironmentalSensorRelationship",
+    "MonitorsRelationship": ".MonitorsRelationship",
+    "MonitorsTrustOfRelationship": ".MonitorsTrustOfRelationship",
+    "ProducesWasteRelationship": ".ProducesWasteRelationship",
+    "ProtectsAssetRelationship": ".ProtectsAssetRelationship",
+    "ProtectsRelationship": ".ProtectsRelationship",
+    "SuppliedByRelationship": ".SuppliedByRelationship",
+    "TriggersRelationship": ".TriggersRelationship",
+    "TrustsRelationship": ".TrustsRelationship",
+    "UnionAllAssets": ".UnionAllAssets",
+    "UnionOTDeviceGridComponent": ".UnionOTDeviceGridComponent",
+    "UnionOTDeviceIdentity": ".UnionOTDeviceIdentity",
+    "UnionPhysicalAssetGridComponent": ".UnionPhysicalAssetGridComponent",
+    "UnionPhysicalAssetOTDevice": ".UnionPhysicalAssetOTDevice",
+    "UnionSecurityZoneLocation": ".UnionSecurityZoneLocation",
+    "UnionSecurityZoneOTDeviceCourseOfAction": ".UnionSecurityZoneOTDeviceCourseOfAction",
+    "VerifiesIdentityOfRelationship": ".VerifiesIdentityOfRelationship",
+    "WithinSecurityZoneRelationship": ".WithinSecurityZoneRelationship",
+}
+
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = (
+    "UnionAllAssets",
+    "UnionPhysicalAssetGridComponent",
 )
 
 
-from .MonitorsRelationship import MonitorsRelationship
-
-
-from .MonitorsTrustOfRelationship import MonitorsTrustOfRelationship
-
-
-from .ProducesWasteRelationship import ProducesWasteRelationship
-
-
-from .ProtectsAssetRelationship import ProtectsAssetRelationship
-
-
-from .ProtectsRelationship import ProtectsRelationship
-
-
-from .SuppliedByRelationship import SuppliedByRelationship
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
 
 
-from .TriggersRelationship import TriggersRelationship
-
-
-from .TrustsRelationship import TrustsRelationship
-
-
-from .UnionAllAssets import UnionAllAssets
-
-
-from .UnionOTDeviceGridComponent import UnionOTDeviceGridComponent
-
-
-from .UnionOTDeviceIdentity import UnionOTDeviceIdentity
-
-
-from .UnionPhysicalAssetGridComponent import UnionPhysicalAssetGridComponent
-
-
-from .UnionPhysicalAssetOTDevice import UnionPhysicalAssetOTDevice
-
-
-from .UnionSecurityZoneLocation import UnionSecurityZoneLocation
-
-
-from .UnionSecurityZoneOTDeviceCourseOfAction import (
-    UnionSecurityZoneOTDeviceCourseOfAction,
-)
-
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
 
-from .VerifiesIdentityOfRelationship import VerifiesIdentityOfRelationship
 
+sys.modules[__name__].__class__ = _LazyModule
 
-from .WithinSecurityZoneRelationship import WithinSecurityZoneRelationship
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
 
-# Resolve forward references
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Only call model_rebuild() if the class has this method (Pydantic models)
-if hasattr(UnionAllAssets, "model_rebuild"):
-    UnionAllAssets.model_rebuild()
 
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
 
-# Only call model_rebuild() if the class has this method (Pydantic models)
-if hasattr(UnionPhysicalAssetGridComponent, "model_rebuild"):
-    UnionPhysicalAssetGridComponent.model_rebuild()
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -183,4 +148,5 @@ __all__ = [
     "UnionSecurityZoneOTDeviceCourseOfAction",
     "VerifiesIdentityOfRelationship",
     "WithinSecurityZoneRelationship",
+    "preload",
 ]
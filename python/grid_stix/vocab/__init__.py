@@ -3,159 +3,116 @@ grid_stix.vocab - Generated Grid-STIX module
 
 This module was automatically generated from the Grid-STIX ontology.
 It contains Python classes corresponding to OWL classes in the ontology.
-"""
-
-# Import all classes from this module
-
-
-from .AlertLevelOv import AlertLevelOv
-
-
-from .AuthenticationFactorOv import AuthenticationFactorOv
-
-
-from .AuthenticationRequirementOv import AuthenticationRequirementOv
-
-
-from .AuthenticationResultOv import AuthenticationResultOv
-
-
-from .CommunicationsStatusOv import CommunicationsStatusOv
-
-
-from .ComplianceFrameworkOv import ComplianceFrameworkOv
-
-
-from .DefensivePostureOv import DefensivePostureOv
-
-
-from .DetectionMethodOv import DetectionMethodOv
-
-
-from .DisasterDeclarationLevelOv import DisasterDeclarationLevelOv
-
-
-from .DisasterTypeOv import DisasterTypeOv
-
-
-from .EmergencyStatusOv import EmergencyStatusOv
-
-
-from .EmergencyTypeOv import EmergencyTypeOv
-
-
-from .EnrichmentLevelOv import EnrichmentLevelOv
-
-
-from .EnvironmentalImpactCategoryOv import EnvironmentalImpactCategoryOv
-
-
-from .FuelTypeOv import FuelTypeOv
-
-
-from .GenerationProfileOv import GenerationProfileOv
-
-
-from .GridComponentOv import GridComponentOv
-
-
-from .GridOperatingConditionOv import GridOperatingConditionOv
-
-
-from .GridProtocolOv import GridProtocolOv
-
-
-from .ImpactTypeOv import ImpactTypeOv
-
-
-from .IncidentResponseStatusOv import IncidentResponseStatusOv
-
-
-from .InspectionTypeOv import InspectionTypeOv
-
-
-from .InterconnectionLevelOv import InterconnectionLevelOv
-
-
-from .MaintenanceStatusOv import MaintenanceStatusOv
-
-
-from .MaintenanceTypeOv import MaintenanceTypeOv
-
-
-from .MonitoringLevelOv import MonitoringLevelOv
-
-
-from .NuclearFacilityTypeOv import NuclearFacilityTypeOv
-
-
-from .NuclearMaterialTypeOv import NuclearMaterialTypeOv
-
-
-from .OTDeviceTypeOv import OTDeviceTypeOv
-
-
-from .OperationalStatusOv import OperationalStatusOv
-
-
-from .OutageCauseOv import OutageCauseOv
-
-
-from .OutageTypeOv import OutageTypeOv
-
-
-from .PotentialImpactOv import PotentialImpactOv
-
-
-from .RadiationDetectionMethodOv import RadiationDetectionMethodOv
-
-
-from .RegulatoryClassificationOv import RegulatoryClassificationOv
-
-
-from .RenewableTypeOv import RenewableTypeOv
-
-
-from .ResponseLevelOv import ResponseLevelOv
-
-
-from .ResponseStatusOv import ResponseStatusOv
-
-
-from .SafeguardMechanismOv import SafeguardMechanismOv
-
-
-from .SafeguardsAgreementTypeOv import SafeguardsAgreementTypeOv
-
-
-from .SafeguardsAnomalyTypeOv import SafeguardsAnomalyTypeOv
-
-
-from .SecurityEventTypeOv import SecurityEventTypeOv
-
-
-from .SecurityZoneTypeOv import SecurityZoneTypeOv
-
-
-from .SensorTypeOv import SensorTypeOv
-
-
-from .StormTypeOv import StormTypeOv
-
-
-from .SupplyChainRiskTypeOv import SupplyChainRiskTypeOv
-
-
-from .TransportationStatusOv import TransportationStatusOv
-
-
-from .TrustLevelOv import TrustLevelOv
-
-
-from .VoltageStatusOv import VoltageStatusOv
 
+Classes are imported from their submodules on first access (PEP 562), so
+importing this package does not load every class module up front.
+"""
 
-from .WeatherTypeOv import WeatherTypeOv
+import importlib
+import sys
+import types
+from typing import Any, List
+
+# Submodule providing each class of this module
+_LAZY_IMPORTS = {
+    "AlertLevelOv": ".AlertLevelOv",
+    "AuthenticationFactorOv": ".AuthenticationFactorOv",
+    "AuthenticationRequirementOv": ".AuthenticationRequirementOv",
+    "AuthenticationResultOv": ".AuthenticationResultOv",
+    "CommunicationsStatusOv": ".CommunicationsStatusOv",
+    "ComplianceFrameworkOv": ".ComplianceFrameworkOv",
+    "DefensivePostureOv": ".DefensivePostureOv",
+    "DetectionMethodOv": ".DetectionMethodOv",
+    "DisasterDeclarationLevelOv": ".DisasterDeclarationLevelOv",
+    "DisasterTypeOv": ".DisasterTypeOv",
+    "EmergencyStatusOv": ".EmergencyStatusOv",
+    "EmergencyTypeOv": ".EmergencyTypeOv",
+    "EnrichmentLevelOv": ".EnrichmentLevelOv",
+    "EnvironmentalImpactCategoryOv": ".EnvironmentalImpactCategoryOv",
+    "FuelTypeOv": ".FuelTypeOv",
+    "GenerationProfileOv": ".GenerationProfileOv",
+    "GridComponentOv": ".GridComponentOv",
+    "GridOperatingConditionOv": ".GridOperatingConditionOv",
+    "GridProtocolOv": ".GridProtocolOv",
+    "ImpactTypeOv": ".ImpactTypeOv",
+    "IncidentResponseStatusOv": ".IncidentResponseStatusOv",
+    "InspectionTypeOv": ".InspectionTypeOv",
+    "InterconnectionLevelOv": ".InterconnectionLevelOv",
+    "MaintenanceStatusOv": ".MaintenanceStatusOv",
+    "MaintenanceTypeOv": ".MaintenanceTypeOv",
+    "MonitoringLevelOv": ".MonitoringLevelOv",
+    "NuclearFacilityTypeOv": ".NuclearFacilityTypeOv",
+    "NuclearMaterialTypeOv": ".NuclearMaterialTypeOv",
+    "OTDeviceTypeOv": ".OTDeviceTypeOv",
+    "OperationalStatusOv": ".OperationalStatusOv",
+    "OutageCauseOv": ".OutageCauseOv",
+    "OutageTypeOv": ".OutageTypeOv",
+    "PotentialImpactOv": ".PotentialImpactOv",
+    "RadiationDetectionMethodOv": ".RadiationDetectionMethodOv",
+    "RegulatoryClassificationOv": ".RegulatoryClassificationOv",
+    "RenewableTypeOv": ".RenewableTypeOv",
+    "ResponseLevelOv": ".ResponseLevelOv",
+    "ResponseStatusOv": ".ResponseStatusOv",
+    "SafeguardMechanismOv": ".SafeguardMechanismOv",
+    "SafeguardsAgreementTypeOv": ".SafeguardsAgreementTypeOv",
+    "SafeguardsAnomalyTypeOv": ".SafeguardsAnomalyTypeOv",
+    "SecurityEventTypeOv": ".SecurityEventTypeOv",
+    "SecurityZoneTypeOv": ".SecurityZoneTypeOv",
+    "SensorTypeOv": ".SensorTypeOv",
+    "StormTypeOv": ".StormTypeOv",
+    "SupplyChainRiskTypeOv": ".SupplyChainRiskTypeOv",
+    "TransportationStatusOv": ".TransportationStatusOv",
+    "TrustLevelOv": ".TrustLevelOv",
+    "VoltageStatusOv": ".VoltageStatusOv",
+    "WeatherTypeOv": ".WeatherTypeOv",
+}
+
+# Classes whose forward references are resolved on first access
+_FORWARD_REF_CLASSES = ()
+
+
+def _resolve(name: str, module: types.ModuleType) -> Any:
+    value = getattr(module, name)
+    # Only call model_rebuild() if the class has this method (Pydantic models)
+    if name in _FORWARD_REF_CLASSES and hasattr(value, "model_rebuild"):
+        value.model_rebuild()
+    return value
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule directly binds it on this package under the
+        # class name; keep the class itself bound there instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = _resolve(name, value)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = _resolve(name, module)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+def preload() -> None:
+    """Import every class of this module now instead of on first access.
+
+    Long-running services can call this at startup so the first request does
+    not pay for the imports.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
 
 # Public API
@@ -210,4 +167,5 @@ __all__ = [
     "TrustLevelOv",
     "VoltageStatusOv",
     "WeatherTypeOv",
+    "preload",
 ]
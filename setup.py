@@ -1,12 +0,0 @@
-#!/usr/bin/env python3
-"""
-Setup script for grid-stix package.
-
-This is a minimal setup.py for backward compatibility.
-All configuration is in pyproject.toml.
-"""
-
-from setuptools import setup
-
-# All configuration is in pyproject.toml
-setup()
\ No newline at end of file
@@ -1,18 +1,33 @@
-from rdflib import Graph, RDF, RDFS, OWL, URIRef, BNode, Namespace
-from collections import defaultdict
-from networkx import DiGraph, strongly_connected_components
+from rdflib import Graph, RDF, RDFS, OWL, URIRef, BNode, Namespace, plugin
+from rdflib.parser import Parser
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import Store
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+import hashlib
 import logging
+import multiprocessing
 import re
+import shutil
+import subprocess  # nosec B404 - only used to invoke rapper with list args
 import sys
 import os
 import argparse
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:  # optional: lets import discovery skip every element but owl:imports
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
 
 logging.basicConfig(
     level=logging.WARNING,
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
+logger = logging.getLogger(__name__)
 
 # Naming convention patterns
 # URI patterns (rdf:about) - should use hyphens (kebab-case)
@@ -25,6 +40,20 @@ LABEL_PATTERN = r"^[a-z][a-z0-9]*(?:_[a-z0-9]+)*$"
 # Legacy technical pattern for backwards compatibility
 TECHNICAL_NAMING_PATTERN = r"^[A-Za-z][A-Za-z0-9]*(?:_[A-Za-z0-9]+)*$"
 
+# Compiled matchers for the naming patterns above, bound once at import
+_CLASS_URI_MATCH = re.compile(CLASS_URI_PATTERN).fullmatch
+_PROPERTY_URI_MATCH = re.compile(PROPERTY_URI_PATTERN).fullmatch
+_PROPERTY_URI_PREFIX_MATCH = re.compile(PROPERTY_URI_PATTERN).match
+_LABEL_MATCH = re.compile(LABEL_PATTERN).fullmatch
+_TECHNICAL_NAME_MATCH = re.compile(TECHNICAL_NAMING_PATTERN).fullmatch
+
+# Case conversion patterns, compiled once instead of on every conversion call
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_MULTI_HYPHEN = re.compile(r"-+")
+_MULTI_UNDERSCORE = re.compile(r"_+")
+_TO_HYPHEN = str.maketrans("_", "-")
+_TO_UNDERSCORE = str.maketrans("-", "_")
+
 
 # ---- ARGUMENT PARSING ----
 def parse_arguments():
@@ -53,6 +82,11 @@ def parse_arguments():
         default=[],
         help='List of check types to skip (e.g., "missing_inverses unreachable uri_naming label_naming")',
     )
+    parser.add_argument(
+        "--nt-cache-dir",
+        default=".ontology_cache",
+        help="Directory for cached N-Triples conversions of OWL files (empty string disables)",
+    )
     return parser.parse_args()
 
 
@@ -62,6 +96,7 @@ OWL_FILE = "ontology/root/grid-stix-2.1-root.owl"
 BASE_NAMESPACE = "http://www.anl.gov/sss/"
 CATALOG_FILE = "ontology/catalog.xml"
 SKIP_CHECKS = []
+NT_CACHE_DIR = ".ontology_cache"
 
 # Define common STIX namespaces
 STIX_NAMESPACES = [
@@ -89,203 +124,471 @@ STIX_CORE_CLASSES = [
 ]
 
 # ---- LOAD CATALOG ----
-import_mappings = {}
-if os.path.exists(CATALOG_FILE):
+# Import URI -> local file path, filled in by load_ontology from the catalog
+import_mappings: Dict[str, str] = {}
+
+
+def load_catalog(catalog_file: str) -> Dict[str, str]:
+    """Read the owl:imports URI to local file mappings from an OASIS XML catalog"""
+    mappings: Dict[str, str] = {}
+    if os.path.exists(catalog_file):
+        try:
+            logger.info(f"Loading import mappings from catalog: {catalog_file}")
+            # Stream the catalog rather than building the whole element tree
+            catalog_events = ET.iterparse(
+                catalog_file
+            )  # nosec B314 - parsing trusted local catalog.xml file
+            for _, mapping in catalog_events:
+                if mapping.tag != "uri" and not mapping.tag.endswith("}uri"):
+                    continue
+                name_attribute = mapping.get(
+                    "name"
+                )  # This is the URI used in owl:imports statements
+                uri_attribute = mapping.get(
+                    "uri"
+                )  # This is the catalog's path to the local file
+                mapping.clear()
+
+                if name_attribute and uri_attribute:
+                    # Start with the URI attribute from the catalog to derive the local file path
+                    local_file_path_str = uri_attribute
+
+                    # Remove "file:" prefix if present
+                    if local_file_path_str.startswith("file:"):
+                        local_file_path_str = local_file_path_str[5:]
+
+                    # Remove fragment identifier to get a clean file path for file system operations.
+                    # The name_attribute (the key for import_mappings) retains its fragment if it has one.
+                    clean_file_path = local_file_path_str.split("#", 1)[0]
+
+                    mappings[name_attribute] = clean_file_path
+                    logger.debug(
+                        f"Mapped import URI '{name_attribute}' → to local file path '{clean_file_path}'"
+                    )
+        except Exception as e:
+            logger.info(f"Warning: Error parsing catalog file: {e}")
+    else:
+        logger.info(f"Catalog file not found: {catalog_file}")
+    return mappings
+
+
+# ---- GRAPH STORE ----
+def _optional_plugin(name: str, kind: type) -> Optional[type]:
+    """Return a registered rdflib plugin class, or None if it is not installed"""
     try:
-        logging.info(f"Loading import mappings from catalog: {CATALOG_FILE}")
-        catalog_tree = ET.parse(
-            CATALOG_FILE
-        )  # nosec B314 - parsing trusted local catalog.xml file
-        catalog_root = catalog_tree.getroot()
-
-        # Get the namespace for the catalog XML
-        ns = {}
-        if catalog_root.tag.startswith("{"):
-            ns_uri = catalog_root.tag[1:].split("}", 1)[0]
-            ns["cat"] = ns_uri
-
-        # Process URI mappings from catalog
-        for mapping in (
-            catalog_root.findall(".//cat:uri", ns)
-            if ns
-            else catalog_root.findall(".//uri")
-        ):
-            name_attribute = mapping.get(
-                "name"
-            )  # This is the URI used in owl:imports statements
-            uri_attribute = mapping.get(
-                "uri"
-            )  # This is the catalog's path to the local file
-
-            if name_attribute and uri_attribute:
-                # Start with the URI attribute from the catalog to derive the local file path
-                local_file_path_str = uri_attribute
-
-                # Remove "file:" prefix if present
-                if local_file_path_str.startswith("file:"):
-                    local_file_path_str = local_file_path_str[5:]
-
-                # Remove fragment identifier to get a clean file path for file system operations.
-                # The name_attribute (the key for import_mappings) retains its fragment if it has one.
-                clean_file_path = local_file_path_str.split("#", 1)[0]
-
-                import_mappings[name_attribute] = clean_file_path
-                logging.debug(
-                    f"Mapped import URI '{name_attribute}' → to local file path '{clean_file_path}'"
+        return plugin.get(name, kind)
+    except plugin.PluginException:
+        return None
+
+
+# The optional oxrdflib package registers a Rust-backed Oxigraph store and parsers
+# that load and index triples much faster than rdflib's default Memory store
+_OXIGRAPH_STORE = _optional_plugin("Oxigraph", Store)
+
+
+class InterningMemory(Memory):
+    """Memory store that keeps a single term object per distinct IRI
+
+    Parsers create a fresh URIRef for every occurrence of an IRI. Mapping each
+    one to the first equal object seen lets the store indexes and the checks'
+    sets and dicts hit CPython's identity shortcut instead of comparing strings.
+    """
+
+    def __init__(
+        self, configuration: Optional[str] = None, identifier: Optional[Any] = None
+    ):
+        super().__init__(configuration, identifier)
+        self._terms: Dict[Any, Any] = {}
+
+    def add(self, triple: Any, context: Any, quoted: bool = False) -> None:
+        terms = self._terms
+        s, p, o = triple
+        if isinstance(o, URIRef):
+            o = terms.setdefault(o, o)
+        super().add(
+            (terms.setdefault(s, s), terms.setdefault(p, p), o), context, quoted
+        )
+
+
+def create_graph() -> Graph:
+    """Create the working graph, backed by Oxigraph when oxrdflib is installed"""
+    if _OXIGRAPH_STORE is not None:
+        return Graph(store="Oxigraph")
+    return Graph(store=InterningMemory())
+
+
+def rdf_format(graph: Graph, fmt: str) -> str:
+    """Use oxrdflib's native parser for fmt when graph is backed by Oxigraph"""
+    if (
+        _OXIGRAPH_STORE is not None
+        and isinstance(graph.store, _OXIGRAPH_STORE)
+        and _optional_plugin(f"ox-{fmt}", Parser) is not None
+    ):
+        return f"ox-{fmt}"
+    return fmt
+
+
+# ---- N-TRIPLES CACHE ----
+def _convert_to_ntriples(
+    source: str, cache_path: str, public_id: Optional[str]
+) -> None:
+    """Write an N-Triples copy of an RDF/XML file, using rapper when it is installed"""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        rapper = shutil.which("rapper")
+        if rapper:
+            command = [rapper, "-q", "-i", "rdfxml", "-o", "ntriples", source]
+            if public_id:
+                command.append(public_id)
+            with open(tmp_path, "wb") as out:
+                subprocess.run(  # nosec B603 - list args, no shell
+                    command, stdout=out, check=True, timeout=300
                 )
-    except Exception as e:
-        logging.info(f"Warning: Error parsing catalog file: {e}")
-else:
-    logging.info(f"Catalog file not found: {CATALOG_FILE}")
+        else:
+            converted = Graph()
+            converted.parse(source, publicID=public_id, format="xml")
+            converted.serialize(tmp_path, format="nt", encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def nt_cache_path(path: str, public_id: Optional[str] = None) -> str:
+    """Location of the cached N-Triples conversion for a file and publicID"""
+    source = os.path.abspath(path)
+    key = hashlib.sha1(
+        f"{source}\n{public_id or ''}".encode("utf-8"), usedforsecurity=False
+    ).hexdigest()
+    return os.path.join(NT_CACHE_DIR, f"{key}.nt")
+
+
+def nt_cache_is_fresh(path: str, public_id: Optional[str] = None) -> bool:
+    """Whether a cached conversion exists and is newer than its source file"""
+    if not NT_CACHE_DIR:
+        return False
+    cache_path = nt_cache_path(path, public_id)
+    return os.path.exists(cache_path) and os.path.getmtime(
+        cache_path
+    ) >= os.path.getmtime(path)
 
-# ---- LOAD ONTOLOGY ----
-g = Graph()
-processed_imports = set()  # Keep track of processed import URIs
-
-# Parse main ontology file
-logging.info(f"Loading main ontology: {OWL_FILE}")
-try:
-    g.parse(OWL_FILE, format="xml")
-    # Add the main OWL file's URI to processed_imports if it's a resolvable URI
-    # For now, we assume OWL_FILE is a local path and its corresponding URI might be in import_mappings
-    # or it's the base URI of the ontology itself.
-    # A more robust way would be to get the ontology's URI from its declaration if present.
-except Exception as e:
-    logging.info(f"FATAL: Error parsing main ontology file {OWL_FILE}: {e}")
-    sys.exit(1)
-
-
-# Use a queue to manage imports
-imports_to_process = list(g.objects(None, OWL.imports))
-import_count = 0
-
-if imports_to_process:
-    logging.info(
-        f"Found {len(imports_to_process)} initial owl:imports statements from {OWL_FILE}"
-    )
 
-while imports_to_process:
-    import_uri = imports_to_process.pop(0)  # Get the next URI to process
-    uri_str = str(import_uri)
+def ensure_nt_cache(path: str, public_id: Optional[str] = None) -> Optional[str]:
+    """Return an up-to-date N-Triples cache file for path, or None if unavailable"""
+    if not NT_CACHE_DIR:
+        return None
+    cache_path = nt_cache_path(path, public_id)
+    try:
+        if not nt_cache_is_fresh(path, public_id):
+            _convert_to_ntriples(os.path.abspath(path), cache_path, public_id)
+    except Exception as e:
+        logger.debug(f"N-Triples cache unavailable for {path}: {e}")
+        return None
+    return cache_path
 
-    if uri_str in processed_imports:
-        logging.debug(f"Skipping already processed import: {uri_str}")
-        continue
 
-    logging.debug(f"Processing import: {uri_str}")
-    processed_imports.add(uri_str)
-    import_count += 1
+def parse_with_nt_cache(
+    graph: Graph, path: str, public_id: Optional[str] = None
+) -> None:
+    """Parse an RDF/XML file into graph through a cached N-Triples conversion
 
+    rdflib's N-Triples parser is considerably faster than its RDF/XML parser, so
+    each file is converted once and re-parsed from the cache until the source
+    changes. Falls back to parsing the RDF/XML directly if the cache is disabled
+    or cannot be written.
+    """
+    cache_path = ensure_nt_cache(path, public_id)
+    if cache_path is None:
+        graph.parse(path, publicID=public_id, format=rdf_format(graph, "xml"))
+    else:
+        graph.parse(cache_path, publicID=public_id, format=rdf_format(graph, "nt"))
+
+
+# ---- IMPORT RESOLUTION ----
+_OWL_IMPORTS_TAG = "{http://www.w3.org/2002/07/owl#}imports"
+_RDF_RESOURCE_ATTR = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource"
+
+
+def resolve_import_path(uri_str: str) -> Optional[str]:
+    """Map an owl:imports URI to its local file path through the catalog"""
+    if uri_str in import_mappings:
+        return import_mappings[uri_str]
+    # Fallback: if uri_str has a fragment, try looking up its base URI.
+    uri_base = uri_str.split("#", 1)[0]
+    if uri_base != uri_str and uri_base in import_mappings:
+        logger.debug(f"Used base URI '{uri_base}' from catalog for import '{uri_str}'")
+        return import_mappings[uri_base]
+    return None
+
+
+def scan_owl_imports(path: str) -> List[str]:
+    """Collect owl:imports targets from an RDF/XML file without building a graph"""
+    imports = []
+    if lxml_etree is not None:
+        # lxml filters by tag in C, so only owl:imports elements reach Python
+        for _, elem in lxml_etree.iterparse(  # nosec B320 - trusted local files
+            path, tag=_OWL_IMPORTS_TAG, resolve_entities=False, no_network=True
+        ):
+            resource = elem.get(_RDF_RESOURCE_ATTR)
+            if resource:
+                imports.append(resource)
+            elem.clear()
+        return imports
+
+    events = ET.iterparse(path)  # nosec B314 - parsing trusted local ontology files
+    for _, elem in events:
+        if elem.tag == _OWL_IMPORTS_TAG:
+            resource = elem.get(_RDF_RESOURCE_ATTR)
+            if resource:
+                imports.append(resource)
+        elem.clear()
+    return imports
+
+
+def _prepare_ntriples(
+    job: Tuple[str, str],
+) -> Tuple[Optional[str], Optional[bytes], Optional[str]]:
+    """Convert one import to N-Triples; returns (cache path, raw data, error)"""
+    uri_str, path = job
     try:
-        # uri_str is the URI from the owl:imports statement (e.g., http://stixschema.org/v21#Identity)
-        # local_path_from_catalog will be the clean file system path.
-        local_path_from_catalog = None
-        if uri_str in import_mappings:
-            local_path_from_catalog = import_mappings[uri_str]
+        cache_path = ensure_nt_cache(path, uri_str)
+        if cache_path:
+            return cache_path, None, None
+        converted = Graph()
+        converted.parse(path, publicID=uri_str, format="xml")
+        return None, converted.serialize(format="nt", encoding="utf-8"), None
+    except Exception as e:
+        return None, None, str(e)
+
+
+def prepare_imports(
+    jobs: List[Tuple[str, str]], parallel: bool = True
+) -> List[Tuple[Optional[str], Optional[bytes], Optional[str]]]:
+    """Convert (import URI, local path) jobs to N-Triples, in parallel when possible
+
+    Imports whose cache is already fresh are resolved in-process. The rest are
+    parsed in worker processes; a fork context is used so that workers inherit
+    the configured NT_CACHE_DIR rather than re-importing the module defaults.
+    """
+    results = {}
+    pending = []
+    for job in jobs:
+        if nt_cache_is_fresh(job[1], job[0]):
+            results[job] = (nt_cache_path(job[1], job[0]), None, None)
         else:
-            # Fallback: if uri_str has a fragment, try looking up its base URI.
-            uri_base = uri_str.split("#", 1)[0]
-            if uri_base != uri_str and uri_base in import_mappings:
-                local_path_from_catalog = import_mappings[uri_base]
-                logging.debug(
-                    f"Used base URI '{uri_base}' from catalog for import '{uri_str}'"
-                )
+            pending.append(job)
+
+    if (
+        parallel
+        and len(pending) > 1
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(len(pending), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                results.update(zip(pending, executor.map(_prepare_ntriples, pending)))
+        except Exception as e:
+            logger.debug(f"Parallel import parsing unavailable, parsing serially: {e}")
+
+    for job in pending:
+        if job not in results:
+            results[job] = _prepare_ntriples(job)
+    return [results[job] for job in jobs]
 
-        if (
-            local_path_from_catalog
-        ):  # This path is already cleaned by catalog loading logic
-            if os.path.exists(local_path_from_catalog):
-                logging.info(
-                    f"Loading import ({import_count}): {uri_str} → {local_path_from_catalog}"
-                )
-                try:
-                    # Use uri_str (the original import URI) as publicID.
-                    # This helps rdflib associate the loaded triples with the correct import URI context.
-                    g.parse(local_path_from_catalog, publicID=uri_str, format="xml")
-
-                    # After parsing, find new imports declared anywhere in the graph
-                    all_current_imports_in_graph = list(g.objects(None, OWL.imports))
-
-                    for new_imp_uri_node in all_current_imports_in_graph:
-                        new_imp_uri_str = str(new_imp_uri_node)
-                        if (
-                            new_imp_uri_str not in processed_imports
-                            and new_imp_uri_node not in imports_to_process
-                        ):
-                            imports_to_process.append(new_imp_uri_node)
-                            logging.debug(
-                                f"Queued new import discovered: {new_imp_uri_str}"
-                            )
-                except Exception as e_parse:
-                    logging.info(
-                        f"Warning: Error parsing imported file {local_path_from_catalog} (from {uri_str}): {e_parse}"
+
+# ---- LOAD ONTOLOGY ----
+def load_ontology(
+    owl_file: str = OWL_FILE,
+    catalog_file: str = CATALOG_FILE,
+    base_namespace: str = BASE_NAMESPACE,
+    parallel: bool = True,
+) -> Graph:
+    """Parse an ontology and its transitive owl:imports into a single graph
+
+    The catalog mappings and base namespace become the module-wide settings
+    used by resolve_import_path and in_namespace.
+    """
+    import_mappings.clear()
+    import_mappings.update(load_catalog(catalog_file))
+    set_namespaces(base_namespace, import_mappings)
+
+    g = create_graph()
+    processed_imports = set()  # Keep track of processed import URIs
+
+    # Parse main ontology file; a failure here is left for the caller to report
+    logger.info(f"Loading main ontology: {owl_file}")
+    parse_with_nt_cache(g, owl_file)
+
+    # Phase 1: resolve the transitive import closure. Local files are scanned for
+    # owl:imports with a streaming XML pass instead of being parsed into the graph.
+    # FIFO queue plus a set of everything ever queued, so that pops and
+    # duplicate checks are O(1) rather than scanning a list
+    imports_to_process = deque(str(uri) for uri in g.objects(None, OWL.imports))
+    queued_imports = set(imports_to_process)
+    import_count = 0
+    local_imports: List[Tuple[str, str]] = []
+
+    if imports_to_process:
+        logger.info(
+            f"Found {len(imports_to_process)} initial owl:imports statements from {owl_file}"
+        )
+
+    while imports_to_process:
+        uri_str = imports_to_process.popleft()  # Get the next URI to process
+
+        if uri_str in processed_imports:
+            logger.debug(f"Skipping already processed import: {uri_str}")
+            continue
+
+        logger.debug(f"Processing import: {uri_str}")
+        processed_imports.add(uri_str)
+        import_count += 1
+
+        try:
+            # uri_str is the URI from the owl:imports statement (e.g., http://stixschema.org/v21#Identity)
+            # local_path_from_catalog will be the clean file system path.
+            local_path_from_catalog = resolve_import_path(uri_str)
+            discovered: List[str] = []
+
+            if local_path_from_catalog:
+                if os.path.exists(local_path_from_catalog):
+                    logger.info(
+                        f"Resolved import ({import_count}): {uri_str} → {local_path_from_catalog}"
                     )
-            else:
-                logging.info(
-                    f"Warning: Import file not found: {local_path_from_catalog} (mapped from {uri_str})"
-                )
-        else:
-            # Attempt to parse directly if it's a URL and not in mappings (rdflib might handle it)
-            if uri_str.startswith("http://") or uri_str.startswith("https://"):
-                logging.info(f"Attempting to load unmapped URI directly: {uri_str}")
+                    local_imports.append((uri_str, local_path_from_catalog))
+                    try:
+                        discovered = scan_owl_imports(local_path_from_catalog)
+                    except Exception as e_scan:
+                        logger.info(
+                            f"Warning: Error scanning imported file {local_path_from_catalog} (from {uri_str}): {e_scan}"
+                        )
+                else:
+                    logger.info(
+                        f"Warning: Import file not found: {local_path_from_catalog} (mapped from {uri_str})"
+                    )
+            elif uri_str.startswith("http://") or uri_str.startswith("https://"):
+                # Attempt to parse directly if it's a URL and not in mappings (rdflib might handle it)
+                logger.info(f"Attempting to load unmapped URI directly: {uri_str}")
                 try:
-                    g.parse(uri_str, format="xml")  # Or try to infer format
-                    # Check for new imports from this directly loaded URI
-                    all_current_imports_in_graph = list(g.objects(None, OWL.imports))
-                    for new_imp_uri in all_current_imports_in_graph:
-                        if (
-                            str(new_imp_uri) not in processed_imports
-                            and new_imp_uri not in imports_to_process
-                        ):
-                            imports_to_process.append(new_imp_uri)
-                            logging.debug(
-                                f"Queued new import discovered from direct load: {new_imp_uri}"
-                            )
+                    # Parse into a scratch graph so only this document's imports
+                    # are scanned, then merge it into the main graph
+                    remote = create_graph()
+                    remote.parse(uri_str, format=rdf_format(remote, "xml"))
+                    discovered = [str(uri) for uri in remote.objects(None, OWL.imports)]
+                    g += remote
                 except Exception as e_direct_parse:
-                    logging.info(
+                    logger.info(
                         f"Warning: Could not load unmapped URI {uri_str} directly: {e_direct_parse}"
                     )
             else:
-                logging.info(
+                logger.info(
                     f"Warning: No catalog mapping for {uri_str} and it's not a recognized URL."
                 )
-    except Exception as e:
-        logging.info(f"Error processing import {uri_str}: {e}")
-
-if import_count > 0:
-    logging.info(f"Finished processing {import_count} import(s) recursively.")
-else:
-    logging.info("No owl:imports statements were processed.")
-
-# Print stats about loaded ontology
-logging.info(f"Loaded {len(g)} triples")
-logging.info(f"Found {len(list(g.subjects(RDF.type, OWL.Class)))} classes")
-logging.info(
-    f"Found {len(list(g.subjects(RDF.type, OWL.ObjectProperty)))} object properties"
-)
 
-# Log import URIs to help debugging
-logging.debug("Import URIs in graph:")
-for s, o in g.subject_objects(OWL.imports):
-    logging.debug(f"  {s} imports {o}")
-
-logging.debug("Classes directly inheriting from owl:Thing:")
-for s in g.subjects(RDFS.subClassOf, OWL.Thing):
-    logging.debug(f"  {s}")
-
-logging.debug("Namespaces in graph:")
-namespaces: Set[str] = set()
-for s, p, o in g:
-    if isinstance(s, URIRef):
-        ns_uri = (
-            str(s).split("#")[0] if "#" in str(s) else str(s).rsplit("/", 1)[0] + "/"
-        )
-        namespaces.add(ns_uri)
-for namespace in sorted(namespaces):
-    logging.debug(f"  {namespace}")
+            for new_imp_uri_str in discovered:
+                if new_imp_uri_str not in queued_imports:
+                    queued_imports.add(new_imp_uri_str)
+                    imports_to_process.append(new_imp_uri_str)
+                    logger.debug(f"Queued new import discovered: {new_imp_uri_str}")
+        except Exception as e:
+            logger.info(f"Error processing import {uri_str}: {e}")
+
+    # Phase 2: parse the local imports in worker processes, then merge them here.
+    for (uri_str, local_path_from_catalog), (cache_path, data, error) in zip(
+        local_imports, prepare_imports(local_imports, parallel=parallel)
+    ):
+        logger.info(f"Loading import: {uri_str} → {local_path_from_catalog}")
+        try:
+            if error:
+                raise RuntimeError(error)
+            # Use uri_str (the original import URI) as publicID.
+            # This helps rdflib associate the loaded triples with the correct import URI context.
+            if cache_path:
+                g.parse(cache_path, publicID=uri_str, format=rdf_format(g, "nt"))
+            else:
+                g.parse(data=data, publicID=uri_str, format=rdf_format(g, "nt"))
+        except Exception as e_parse:
+            logger.info(
+                f"Warning: Error parsing imported file {local_path_from_catalog} (from {uri_str}): {e_parse}"
+            )
+
+    if import_count > 0:
+        logger.info(f"Finished processing {import_count} import(s) recursively.")
+    else:
+        logger.info("No owl:imports statements were processed.")
+
+    # Print stats about loaded ontology
+    logger.info(f"Loaded {len(g)} triples")
+    logger.info(f"Found {sum(1 for _ in g.subjects(RDF.type, OWL.Class))} classes")
+    logger.info(
+        f"Found {sum(1 for _ in g.subjects(RDF.type, OWL.ObjectProperty))} object properties"
+    )
+
+    # Log import URIs to help debugging; these walks are skipped unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Import URIs in graph:")
+        for s, o in g.subject_objects(OWL.imports):
+            logger.debug(f"  {s} imports {o}")
+
+        logger.debug("Classes directly inheriting from owl:Thing:")
+        for s in g.subjects(RDFS.subClassOf, OWL.Thing):
+            logger.debug(f"  {s}")
+
+        logger.debug("Namespaces in graph:")
+        namespaces: Set[str] = set()
+        # Each distinct subject is examined once; URIRef is already a str, so the
+        # namespace is sliced out directly rather than via str() and split()
+        for s in g.subjects(unique=True):
+            if isinstance(s, URIRef):
+                hash_at = s.find("#")
+                if hash_at >= 0:
+                    namespaces.add(s[:hash_at])
+                else:
+                    slash_at = s.rfind("/")
+                    namespaces.add(s[: slash_at + 1] if slash_at >= 0 else s + "/")
+        for namespace in sorted(namespaces):
+            logger.debug(f"  {namespace}")
+
+    return g
 
 
 # ---- FILTER FUNCTION ----
+# Namespace prefixes are fixed once the catalog is loaded; str.startswith accepts
+# a tuple, so each membership test is a single C-level prefix scan. The unbound
+# str method is used because rdflib's Identifier.startswith stringifies its prefix.
+_PRIMARY_PREFIXES: Tuple[str, ...] = (BASE_NAMESPACE,)
+_IMPORT_PREFIXES: Tuple[str, ...] = _PRIMARY_PREFIXES + tuple(STIX_NAMESPACES)
+
+
+@lru_cache(maxsize=None)
+def _in_primary(uri: Union[URIRef, str]) -> bool:
+    """Cached primary-namespace membership test for in_namespace"""
+    return isinstance(uri, URIRef) and str.startswith(uri, _PRIMARY_PREFIXES)
+
+
+@lru_cache(maxsize=None)
+def _in_primary_or_imports(uri: Union[URIRef, str]) -> bool:
+    """Cached primary, STIX or imported namespace membership test for in_namespace"""
+    return isinstance(uri, URIRef) and str.startswith(uri, _IMPORT_PREFIXES)
+
+
+def set_namespaces(base_namespace: str, mappings: Dict[str, str]) -> None:
+    """Set the base namespace and catalog import URIs that in_namespace accepts"""
+    global BASE_NAMESPACE, _PRIMARY_PREFIXES, _IMPORT_PREFIXES
+    BASE_NAMESPACE = base_namespace
+    _PRIMARY_PREFIXES = (base_namespace,)
+    _IMPORT_PREFIXES = (
+        _PRIMARY_PREFIXES
+        + tuple(STIX_NAMESPACES)
+        + tuple(dict.fromkeys(uri.split("#", 1)[0] for uri in mappings))
+    )
+    _in_primary.cache_clear()
+    _in_primary_or_imports.cache_clear()
+
+
 def in_namespace(uri: Union[URIRef, str], include_imports: bool = False) -> bool:
     """Check if URI is in the ontology's namespace or other included namespaces
 
@@ -293,27 +596,44 @@ def in_namespace(uri: Union[URIRef, str], include_imports: bool = False) -> bool
         uri: The URI to check
         include_imports: Whether to include imported ontologies in the check
     """
-    if not isinstance(uri, URIRef):
-        return False
-    uri_str = str(uri)
+    if include_imports:
+        return _in_primary_or_imports(uri)
+    return _in_primary(uri)
 
-    # Always include entities in our primary namespace
-    if uri_str.startswith(BASE_NAMESPACE):
-        return True
 
-    # For imported URIs
-    if include_imports:
-        # Include STIX entities
-        for stix_ns in STIX_NAMESPACES:
-            if uri_str.startswith(stix_ns):
-                return True
+# ---- GRAPH INDEX ----
+@dataclass
+class GraphIndex:
+    """Per-type and per-predicate buckets collected in one pass over a graph"""
+
+    subjects_by_type: Dict[Any, Set[Any]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+    types_of: Dict[Any, Set[Any]] = field(default_factory=lambda: defaultdict(set))
+    predicates_of: Dict[Any, Set[Any]] = field(default_factory=lambda: defaultdict(set))
+    used_predicates: Set[Any] = field(default_factory=set)
+    labels: List[Tuple[Any, Any]] = field(default_factory=list)
+    disjoint_pairs: List[Tuple[Any, Any]] = field(default_factory=list)
+    inverse_linked: Set[Any] = field(default_factory=set)
 
-        # Include entities from explicitly imported ontologies
-        for import_uri in import_mappings.keys():
-            if uri_str.startswith(import_uri.split("#")[0]):
-                return True
 
-    return False
+def build_graph_index(graph: Graph) -> GraphIndex:
+    """Collect every bucket the checks need with a single scan of the triples"""
+    index = GraphIndex()
+    for s, p, o in graph:
+        index.predicates_of[s].add(p)
+        index.used_predicates.add(p)
+        if p == RDF.type:
+            index.types_of[s].add(o)
+            index.subjects_by_type[o].add(s)
+        elif p == RDFS.label:
+            index.labels.append((s, o))
+        elif p == OWL.disjointWith:
+            index.disjoint_pairs.append((s, o))
+        elif p == OWL.inverseOf:
+            index.inverse_linked.add(s)
+            index.inverse_linked.add(o)
+    return index
 
 
 # ---- STIX 2.1 SPECIFIC CHECK FUNCTIONS ----
@@ -407,7 +727,7 @@ def check_stix_property_patterns(graph: Graph) -> List[str]:
                     continue
 
                 # Check naming convention (should follow kebab-case for Grid-STIX property URIs)
-                if not re.match(PROPERTY_URI_PATTERN, prop_name):
+                if not _PROPERTY_URI_PREFIX_MATCH(prop_name):
                     non_compliant_properties.append(prop_str)
 
     return non_compliant_properties
@@ -610,16 +930,21 @@ def check_unresolved_type_references(graph: Graph) -> List[str]:
 
 
 # ---- CHECK FUNCTIONS ----
-def find_properties_missing_domain_range(graph: Graph) -> Tuple[List[str], List[str]]:
+def find_properties_missing_domain_range(
+    graph: Graph, index: Optional[GraphIndex] = None
+) -> Tuple[List[str], List[str]]:
     """Find properties that lack domain or range declarations"""
+    if index is None:
+        index = build_graph_index(graph)
     missing_domain, missing_range = [], []
     for prop_type in [OWL.ObjectProperty, OWL.DatatypeProperty]:
-        for prop in graph.subjects(RDF.type, prop_type):
+        for prop in index.subjects_by_type[prop_type]:
             # Only check properties in our primary namespace
             if in_namespace(prop):
-                if not list(graph.objects(prop, RDFS.domain)):
+                prop_predicates = index.predicates_of[prop]
+                if RDFS.domain not in prop_predicates:
                     missing_domain.append(str(prop))
-                if not list(graph.objects(prop, RDFS.range)):
+                if RDFS.range not in prop_predicates:
                     missing_range.append(str(prop))
     return missing_domain, missing_range
 
@@ -630,9 +955,11 @@ def find_incomplete_unionOf_lists(graph: Graph) -> List[Tuple[str, str]]:
     for subj, union_node in graph.subject_objects(OWL.unionOf):
         # Only check classes in our primary namespace
         if isinstance(union_node, BNode) and in_namespace(subj):
-            first = list(graph.objects(union_node, RDF.first))
-            rest = list(graph.objects(union_node, RDF.rest))
-            if not first or not rest:
+            # Only existence matters, so stop at the first matching triple
+            if (
+                next(iter(graph.objects(union_node, RDF.first)), None) is None
+                or next(iter(graph.objects(union_node, RDF.rest)), None) is None
+            ):
                 broken_unions.append((str(subj), str(union_node)))
     return broken_unions
 
@@ -643,24 +970,31 @@ def find_isolated_classes(graph: Graph) -> List[str]:
     declared_classes = set(
         s for s in graph.subjects(RDF.type, OWL.Class) if in_namespace(s)
     )
-    connected = set()
-    for s, p, o in graph:
-        if s in declared_classes or o in declared_classes:
-            connected.add(s)
-            connected.add(o)
-    return sorted(str(cls) for cls in (declared_classes - connected))
+    # Query each class's own triples through the store indexes rather than
+    # scanning the whole graph; its owl:Class declaration alone does not count
+    isolated = set()
+    for cls in declared_classes:
+        if any(
+            p != RDF.type or o != OWL.Class for p, o in graph.predicate_objects(cls)
+        ):
+            continue
+        if next(iter(graph.subject_predicates(cls)), None) is not None:
+            continue
+        isolated.add(cls)
+    return sorted(str(cls) for cls in isolated)
 
 
-def find_missing_inverse_properties(graph: Graph) -> List[str]:
+def find_missing_inverse_properties(
+    graph: Graph, index: Optional[GraphIndex] = None
+) -> List[str]:
     """Find object properties that lack inverse property declarations"""
+    if index is None:
+        index = build_graph_index(graph)
     # Only check properties in our primary namespace
     properties = set(
-        s for s in graph.subjects(RDF.type, OWL.ObjectProperty) if in_namespace(s)
+        s for s in index.subjects_by_type[OWL.ObjectProperty] if in_namespace(s)
     )
-    has_inverse = set(graph.subjects(OWL.inverseOf, None))
-    inverse_targets = set(graph.objects(None, OWL.inverseOf))
-    all_with_inverse = has_inverse.union(inverse_targets)
-    return sorted(str(p) for p in (properties - all_with_inverse))
+    return sorted(str(p) for p in (properties - index.inverse_linked))
 
 
 def check_unreachable_classes(graph: Graph) -> List[str]:
@@ -677,41 +1011,46 @@ def check_unreachable_classes(graph: Graph) -> List[str]:
         and "union-" not in str(s)  # Grid-STIX union- classes (kebab-case)
     )  # in_namespace defaults to include_imports=False
 
-    logging.info(
+    logger.info(
         f"Checking reachability for {len(all_classes_in_ns)} classes in {BASE_NAMESPACE} (after filtering _ov/Union_)"
     )
 
-    # 1. Find all classes that are descendants of owl:Thing
-    reachable_descendants_of_owl_thing = set()
-    visited_for_owl_dfs = set()
-
-    def dfs_from_owl_thing(cls_node: URIRef) -> None:
-        if cls_node in visited_for_owl_dfs:
-            return
-        visited_for_owl_dfs.add(cls_node)
-        reachable_descendants_of_owl_thing.add(cls_node)  # Add any descendant
+    # Index rdfs:subClassOf once in both directions. Blank-node superclasses
+    # (restrictions, unions) can never be STIX classes and end a traversal,
+    # so only URIRef edges are kept.
+    children: Dict[URIRef, List[URIRef]] = defaultdict(list)
+    parents: Dict[URIRef, List[URIRef]] = defaultdict(list)
+    for sub_class, super_class in graph.subject_objects(RDFS.subClassOf):
+        if isinstance(sub_class, URIRef) and isinstance(super_class, URIRef):
+            children[super_class].append(sub_class)
+            parents[sub_class].append(super_class)
 
-        for sub_class in graph.subjects(RDFS.subClassOf, cls_node):
-            if isinstance(sub_class, URIRef):  # Process only URIRefs
-                dfs_from_owl_thing(sub_class)
+    # 1. Find all classes that are descendants of owl:Thing
+    reachable_descendants_of_owl_thing: Set[URIRef] = set()
 
-    logging.info(f"Starting DFS for descendants of owl:Thing...")
-    dfs_from_owl_thing(OWL.Thing)
+    logger.info(f"Starting DFS for descendants of owl:Thing...")
+    stack = [OWL.Thing]
+    while stack:
+        cls_node = stack.pop()
+        if cls_node in reachable_descendants_of_owl_thing:
+            continue
+        reachable_descendants_of_owl_thing.add(cls_node)
+        stack.extend(children[cls_node])
 
     # Filter to get classes in our namespace that are descendants of OWL.Thing
     reachable_in_ns_via_owl = all_classes_in_ns.intersection(
         reachable_descendants_of_owl_thing
     )
 
-    logging.debug(
+    logger.debug(
         f"Total descendants of owl:Thing found: {len(reachable_descendants_of_owl_thing)}"
     )
-    logging.debug(
+    logger.debug(
         f"Classes in '{BASE_NAMESPACE}' reachable from owl:Thing: {len(reachable_in_ns_via_owl)}"
     )
     sample_owl = list(reachable_in_ns_via_owl)[:5]
     if sample_owl:
-        logging.debug(
+        logger.debug(
             f"  Sample (from owl:Thing): {', '.join(str(c) for c in sample_owl)}"
         )
 
@@ -720,134 +1059,182 @@ def check_unreachable_classes(graph: Graph) -> List[str]:
     candidates_for_stix_check = all_classes_in_ns - reachable_in_ns_via_owl
 
     truly_unreachable_classes = set()
-
-    # Helper function to check for STIX ancestors (traverses upwards via rdfs:subClassOf)
-    def has_stix_ancestor(
-        cls_uri: Union[URIRef, BNode],
-        current_graph: Graph,
-        visited_ancestor_nodes: Set[Union[URIRef, BNode]],
-    ) -> bool:
-        if cls_uri in visited_ancestor_nodes:
-            return False  # Cycle detected or path already checked
-        visited_ancestor_nodes.add(cls_uri)
-
-        if not isinstance(cls_uri, URIRef):  # Blank nodes cannot be STIX classes by URI
-            return False
-
-        # Check if the current class URI itself starts with any of the STIX namespaces
-        for stix_ns in STIX_NAMESPACES:
-            if str(cls_uri).startswith(stix_ns):
-                return True
-
-        # Traverse upwards to superclasses
-        for super_class_node in current_graph.objects(cls_uri, RDFS.subClassOf):
-            if has_stix_ancestor(
-                super_class_node, current_graph, visited_ancestor_nodes
-            ):
-                return True
-        return False
+    stix_prefixes = tuple(STIX_NAMESPACES)
+
+    # A class has a STIX ancestor exactly when it is a descendant of some STIX
+    # class, so one downward sweep from every STIX superclass answers all
+    # candidates at once. Unlike a topological pass this also tolerates
+    # subclass cycles.
+    stix_descendants: Set[URIRef] = set()
+    stack = [
+        super_class
+        for super_class in children
+        if str.startswith(super_class, stix_prefixes)
+    ]
+    while stack:
+        for sub_class in children.get(stack.pop(), ()):
+            if sub_class not in stix_descendants:
+                stix_descendants.add(sub_class)
+                stack.append(sub_class)
 
     if candidates_for_stix_check:
-        logging.debug(
+        logger.debug(
             f"Found {len(candidates_for_stix_check)} classes in '{BASE_NAMESPACE}' not descending from owl:Thing. "
             f"Now checking them for STIX ancestry..."
         )
 
     for cls_candidate in candidates_for_stix_check:
-        visited_for_this_stix_check: Set[Union[URIRef, BNode]] = (
-            set()
-        )  # Fresh set for each candidate's upward search
-        if not has_stix_ancestor(cls_candidate, graph, visited_for_this_stix_check):
+        if cls_candidate not in stix_descendants:
             truly_unreachable_classes.add(cls_candidate)
-            logging.debug(
+            logger.debug(
                 f"  Class {cls_candidate} is TRULY UNREACHABLE (no STIX ancestor)."
             )
         else:
-            logging.debug(
+            logger.debug(
                 f"  Class {cls_candidate} has a STIX ancestor, considered reachable."
             )
 
     effectively_reachable_in_ns = all_classes_in_ns - truly_unreachable_classes
-    logging.debug(
+    logger.debug(
         f"Total effectively reachable classes in '{BASE_NAMESPACE}': {len(effectively_reachable_in_ns)}"
     )
     sample_effective = list(effectively_reachable_in_ns)[:5]
     if sample_effective:
-        logging.debug(
+        logger.debug(
             f"  Sample (effectively reachable): {', '.join(str(c) for c in sample_effective)}"
         )
 
     return sorted(str(c) for c in truly_unreachable_classes)
 
 
+def _strongly_connected_components(
+    adjacency: Dict[URIRef, List[URIRef]],
+) -> List[Set[URIRef]]:
+    """Tarjan's SCC algorithm with an explicit stack (no recursion limit)"""
+    index: Dict[URIRef, int] = {}
+    lowlink: Dict[URIRef, int] = {}
+    on_stack: Set[URIRef] = set()
+    stack: List[URIRef] = []
+    components: List[Set[URIRef]] = []
+
+    for root in list(adjacency):
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency.get(root, ())))]
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(adjacency.get(succ, ()))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                # All successors explored: propagate lowlink and pop a component
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
 def check_subclass_cycles(graph: Graph) -> List[List[str]]:
     """Find cycles in the subClassOf hierarchy"""
-    g_sub = DiGraph()
+    adjacency: Dict[URIRef, List[URIRef]] = defaultdict(list)
     for s, o in graph.subject_objects(RDFS.subClassOf):
         # Only check for cycles in our primary namespace
         if in_namespace(s) and in_namespace(o):
-            g_sub.add_edge(s, o)
+            adjacency[s].append(o)
     cycles = [
         sorted(str(n) for n in scc)
-        for scc in strongly_connected_components(g_sub)
+        for scc in _strongly_connected_components(adjacency)
         if len(scc) > 1
     ]
-    return cycles
+    return sorted(cycles)
 
 
-def check_undeclared_properties(graph: Graph) -> List[str]:
+def check_undeclared_properties(
+    graph: Graph, index: Optional[GraphIndex] = None
+) -> List[str]:
     """Find properties used but not declared with a specific property type"""
+    if index is None:
+        index = build_graph_index(graph)
     # Only check properties in our primary namespace
-    used_props = set(p for s, p, o in graph if in_namespace(p))
-    declared_props = set(graph.subjects(RDF.type, RDF.Property)).union(
-        graph.subjects(RDF.type, OWL.ObjectProperty),
-        graph.subjects(RDF.type, OWL.DatatypeProperty),
-        graph.subjects(RDF.type, OWL.AnnotationProperty),
+    used_props = set(p for p in index.used_predicates if in_namespace(p))
+    declared_props = set(index.subjects_by_type[RDF.Property]).union(
+        index.subjects_by_type[OWL.ObjectProperty],
+        index.subjects_by_type[OWL.DatatypeProperty],
+        index.subjects_by_type[OWL.AnnotationProperty],
     )
     undeclared = used_props - declared_props
     return sorted(str(p) for p in undeclared)
 
 
-def check_disjoint_violations(graph: Graph) -> List[Tuple[str, str, str]]:
+def check_disjoint_violations(
+    graph: Graph, index: Optional[GraphIndex] = None
+) -> List[Tuple[str, str, str]]:
     """Find instances that belong to disjoint classes"""
+    if index is None:
+        index = build_graph_index(graph)
     # Only check for disjoint violations in our primary namespace
     disjoints = [
-        (a, b)
-        for a, b in graph.subject_objects(OWL.disjointWith)
-        if in_namespace(a) and in_namespace(b)
+        (a, b) for a, b in index.disjoint_pairs if in_namespace(a) and in_namespace(b)
     ]
-    instance_types = defaultdict(set)
-    for inst, cls in graph.subject_objects(RDF.type):
-        if in_namespace(inst):
-            instance_types[inst].add(cls)
+    # Join on the per-class instance sets: one intersection per disjoint pair
+    # instead of testing every pair against every instance
+    instances_of = index.subjects_by_type
     violations = []
-    for inst, types in instance_types.items():
-        for a, b in disjoints:
-            if a in types and b in types:
+    for a, b in disjoints:
+        if a not in instances_of or b not in instances_of:
+            continue
+        for inst in instances_of[a] & instances_of[b]:
+            if in_namespace(inst):
                 violations.append((str(inst), str(a), str(b)))
+    violations.sort()
     return violations
 
 
-def check_missing_labels(graph: Graph) -> List[str]:
+def check_missing_labels(graph: Graph, index: Optional[GraphIndex] = None) -> List[str]:
     """Find entities that lack rdfs:label annotations"""
+    if index is None:
+        index = build_graph_index(graph)
     # Only check for missing labels in our primary namespace
     return sorted(
         str(s)
-        for s in graph.subjects(RDF.type, None)
-        if in_namespace(s) and not list(graph.objects(s, RDFS.label))
+        for s in index.types_of
+        if in_namespace(s) and RDFS.label not in index.predicates_of[s]
     )
 
 
 def is_valid_technical_name(label: str) -> bool:
     """Check if a label follows acceptable technical naming conventions"""
-    return bool(re.fullmatch(TECHNICAL_NAMING_PATTERN, label))
+    return _TECHNICAL_NAME_MATCH(label) is not None
 
 
-def check_invalid_technical_names(graph: Graph) -> List[str]:
+def check_invalid_technical_names(
+    graph: Graph, index: Optional[GraphIndex] = None
+) -> List[str]:
     """Find entities with labels that don't follow technical naming conventions"""
+    if index is None:
+        index = build_graph_index(graph)
     invalid_names = []
     # Only check labels in our primary namespace
-    for s, label in graph.subject_objects(RDFS.label):
+    for s, label in index.labels:
         if in_namespace(s):
             if isinstance(label, str):
                 label_str = label
@@ -886,7 +1273,7 @@ def check_uri_naming_conventions(graph: Graph) -> Dict[str, List[str]]:
             ):
                 continue
 
-            if not re.fullmatch(CLASS_URI_PATTERN, local_name):
+            if not _CLASS_URI_MATCH(local_name):
                 violations["class_uri_violations"].append(
                     f"{cls_str} -> '{local_name}' (should use hyphens: {to_kebab_case(local_name)})"
                 )
@@ -904,7 +1291,7 @@ def check_uri_naming_conventions(graph: Graph) -> Dict[str, List[str]]:
                 else:
                     continue
 
-                if not re.fullmatch(PROPERTY_URI_PATTERN, local_name):
+                if not _PROPERTY_URI_MATCH(local_name):
                     violations["property_uri_violations"].append(
                         f"{prop_str} -> '{local_name}' (should use hyphens: {to_kebab_case(local_name)})"
                     )
@@ -912,11 +1299,15 @@ def check_uri_naming_conventions(graph: Graph) -> Dict[str, List[str]]:
     return violations
 
 
-def check_label_naming_conventions(graph: Graph) -> List[str]:
+def check_label_naming_conventions(
+    graph: Graph, index: Optional[GraphIndex] = None
+) -> List[str]:
     """Check that labels follow strict snake_case conventions"""
+    if index is None:
+        index = build_graph_index(graph)
     violations = []
 
-    for s, label in graph.subject_objects(RDFS.label):
+    for s, label in index.labels:
         if in_namespace(s):
             if isinstance(label, str):
                 label_str = label
@@ -927,7 +1318,7 @@ def check_label_naming_conventions(graph: Graph) -> List[str]:
             if label_str.endswith("_ov"):
                 continue
 
-            if not re.fullmatch(LABEL_PATTERN, label_str):
+            if not _LABEL_MATCH(label_str):
                 violations.append(
                     f"{s} -> '{label_str}' (should use snake_case: {to_snake_case(label_str)})"
                 )
@@ -935,330 +1326,332 @@ def check_label_naming_conventions(graph: Graph) -> List[str]:
     return violations
 
 
+@lru_cache(maxsize=4096)
 def to_kebab_case(text: str) -> str:
     """Convert text to kebab-case (hyphens)"""
     # Handle various patterns
     # PascalCase -> kebab-case
-    text = re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", text)
+    text = _CAMEL_BOUNDARY.sub(r"\1-\2", text)
     # snake_case -> kebab-case
-    text = text.replace("_", "-")
-    # Multiple hyphens -> single hyphen
-    text = re.sub(r"-+", "-", text)
+    text = text.translate(_TO_HYPHEN)
+    # Multiple hyphens -> single hyphen (skip the regex when there are none)
+    if "--" in text:
+        text = _MULTI_HYPHEN.sub("-", text)
     # Remove leading/trailing hyphens
     text = text.strip("-")
     return text.lower()
 
 
+@lru_cache(maxsize=4096)
 def to_snake_case(text: str) -> str:
     """Convert text to snake_case (underscores)"""
     # Handle various patterns
     # PascalCase -> snake_case
-    text = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", text)
+    text = _CAMEL_BOUNDARY.sub(r"\1_\2", text)
     # kebab-case -> snake_case
-    text = text.replace("-", "_")
-    # Multiple underscores -> single underscore
-    text = re.sub(r"_+", "_", text)
+    text = text.translate(_TO_UNDERSCORE)
+    # Multiple underscores -> single underscore (skip the regex when there are none)
+    if "__" in text:
+        text = _MULTI_UNDERSCORE.sub("_", text)
     # Remove leading/trailing underscores
     text = text.strip("_")
     return text.lower()
 
 
 # ---- RUN CHECKS ----
-check_results: Dict[str, Any] = {}
+# Check name (as accepted by --skip-checks) -> (check function, result keys).
+# Checks with several result keys return a tuple in key order or a dict by key.
+CHECKS: Dict[str, Tuple[Callable[[Graph], Any], Tuple[str, ...]]] = {
+    "missing_domain_range": (
+        find_properties_missing_domain_range,
+        ("missing_domain", "missing_range"),
+    ),
+    "unionof_issues": (find_incomplete_unionOf_lists, ("unionof_issues",)),
+    "isolated_classes": (find_isolated_classes, ("isolated_classes",)),
+    "missing_inverses": (find_missing_inverse_properties, ("missing_inverses",)),
+    "unreachable": (check_unreachable_classes, ("unreachable",)),
+    "subclass_cycles": (check_subclass_cycles, ("subclass_cycles",)),
+    "undeclared_props": (check_undeclared_properties, ("undeclared_props",)),
+    "disjoint_violations": (check_disjoint_violations, ("disjoint_violations",)),
+    "missing_labels": (check_missing_labels, ("missing_labels",)),
+    "non_snake_labels": (check_invalid_technical_names, ("non_snake_labels",)),
+    # Strict naming convention checks
+    "uri_naming": (
+        check_uri_naming_conventions,
+        ("class_uri_violations", "property_uri_violations"),
+    ),
+    "label_naming": (check_label_naming_conventions, ("label_violations",)),
+    # STIX 2.1 compliance checks
+    "stix_inheritance": (check_stix_inheritance_compliance, ("stix_inheritance",)),
+    "stix_namespace": (check_stix_namespace_consistency, ("stix_namespace",)),
+    "stix_properties": (check_stix_property_patterns, ("stix_properties",)),
+    "stix_relationships": (
+        check_stix_relationship_compliance,
+        ("stix_relationships",),
+    ),
+    "stix_vocabularies": (check_stix_vocabulary_compliance, ("stix_vocabularies",)),
+    "stix_required_properties": (
+        check_stix_required_properties,
+        ("stix_required_properties",),
+    ),
+    "unresolved_types": (check_unresolved_type_references, ("unresolved_types",)),
+}
+
+
+# Checks that read a GraphIndex; run_checks builds one and shares it between them
+INDEXED_CHECKS = frozenset(
+    {
+        find_properties_missing_domain_range,
+        find_missing_inverse_properties,
+        check_undeclared_properties,
+        check_disjoint_violations,
+        check_missing_labels,
+        check_invalid_technical_names,
+        check_label_naming_conventions,
+    }
+)
+
+
+def run_checks(graph: Graph, skip: Iterable[str] = ()) -> Dict[str, Any]:
+    """Run every registered check not named in skip; skipped checks report no issues"""
+    skip = set(skip)
+    check_results: Dict[str, Any] = {}
+    # Built on first use and only valid for this run, while the graph is unchanged
+    index: Optional[GraphIndex] = None
+    for name, (check, keys) in CHECKS.items():
+        if name in skip:
+            check_results.update((key, []) for key in keys)
+            continue
+        if check in INDEXED_CHECKS:
+            if index is None:
+                index = build_graph_index(graph)
+            outcome = check(graph, index)
+        else:
+            outcome = check(graph)
+        if len(keys) == 1:
+            check_results[keys[0]] = outcome
+        elif isinstance(outcome, dict):
+            check_results.update((key, outcome[key]) for key in keys)
+        else:
+            check_results.update(zip(keys, outcome))
+    return check_results
 
-# Only run checks that aren't skipped
-if "missing_domain_range" not in SKIP_CHECKS:
-    check_results["missing_domain"], check_results["missing_range"] = (
-        find_properties_missing_domain_range(g)
-    )
-else:
-    check_results["missing_domain"], check_results["missing_range"] = [], []
-
-if "unionof_issues" not in SKIP_CHECKS:
-    check_results["unionof_issues"] = find_incomplete_unionOf_lists(g)
-else:
-    check_results["unionof_issues"] = []
-
-if "isolated_classes" not in SKIP_CHECKS:
-    check_results["isolated_classes"] = find_isolated_classes(g)
-else:
-    check_results["isolated_classes"] = []
-
-if "missing_inverses" not in SKIP_CHECKS:
-    check_results["missing_inverses"] = find_missing_inverse_properties(g)
-else:
-    check_results["missing_inverses"] = []
-
-if "unreachable" not in SKIP_CHECKS:
-    check_results["unreachable"] = check_unreachable_classes(g)
-else:
-    check_results["unreachable"] = []
-
-if "subclass_cycles" not in SKIP_CHECKS:
-    check_results["subclass_cycles"] = check_subclass_cycles(g)
-else:
-    check_results["subclass_cycles"] = []
-
-if "undeclared_props" not in SKIP_CHECKS:
-    check_results["undeclared_props"] = check_undeclared_properties(g)
-else:
-    check_results["undeclared_props"] = []
-
-if "disjoint_violations" not in SKIP_CHECKS:
-    check_results["disjoint_violations"] = check_disjoint_violations(g)
-else:
-    check_results["disjoint_violations"] = []
-
-if "missing_labels" not in SKIP_CHECKS:
-    check_results["missing_labels"] = check_missing_labels(g)
-else:
-    check_results["missing_labels"] = []
-
-if "non_snake_labels" not in SKIP_CHECKS:
-    check_results["non_snake_labels"] = check_invalid_technical_names(g)
-else:
-    check_results["non_snake_labels"] = []
-
-# New strict naming convention checks
-if "uri_naming" not in SKIP_CHECKS:
-    uri_violations = check_uri_naming_conventions(g)
-    check_results["class_uri_violations"] = uri_violations["class_uri_violations"]
-    check_results["property_uri_violations"] = uri_violations["property_uri_violations"]
-else:
-    check_results["class_uri_violations"] = []
-    check_results["property_uri_violations"] = []
-
-if "label_naming" not in SKIP_CHECKS:
-    check_results["label_violations"] = check_label_naming_conventions(g)
-else:
-    check_results["label_violations"] = []
-
-# STIX 2.1 compliance checks
-if "stix_inheritance" not in SKIP_CHECKS:
-    check_results["stix_inheritance"] = check_stix_inheritance_compliance(g)
-else:
-    check_results["stix_inheritance"] = []
-
-if "stix_namespace" not in SKIP_CHECKS:
-    check_results["stix_namespace"] = check_stix_namespace_consistency(g)
-else:
-    check_results["stix_namespace"] = []
-
-if "stix_properties" not in SKIP_CHECKS:
-    check_results["stix_properties"] = check_stix_property_patterns(g)
-else:
-    check_results["stix_properties"] = []
-
-if "stix_relationships" not in SKIP_CHECKS:
-    check_results["stix_relationships"] = check_stix_relationship_compliance(g)
-else:
-    check_results["stix_relationships"] = []
-
-if "stix_vocabularies" not in SKIP_CHECKS:
-    check_results["stix_vocabularies"] = check_stix_vocabulary_compliance(g)
-else:
-    check_results["stix_vocabularies"] = []
-
-if "stix_required_properties" not in SKIP_CHECKS:
-    check_results["stix_required_properties"] = check_stix_required_properties(g)
-else:
-    check_results["stix_required_properties"] = []
-
-if "unresolved_types" not in SKIP_CHECKS:
-    check_results["unresolved_types"] = check_unresolved_type_references(g)
-else:
-    check_results["unresolved_types"] = []
 
 # ---- PRINT ONLY ISSUES THAT EXIST ----
-issues_found = False
+def report_issues(check_results: Dict[str, Any]) -> bool:
+    """Log every non-empty check result; returns whether any issues were found"""
+    issues_found = False
+
+    if check_results["missing_domain"]:
+        issues_found = True
+        logger.warning("=== MISSING DOMAIN ===")
+        logger.warning(
+            "Properties in your namespace lack an rdfs:domain. Add domain declarations to clarify which classes use them."
+        )
+        logger.warning("\n".join(check_results["missing_domain"]))
 
-if check_results["missing_domain"]:
-    issues_found = True
-    logging.warning("=== MISSING DOMAIN ===")
-    logging.warning(
-        "Properties in your namespace lack an rdfs:domain. Add domain declarations to clarify which classes use them."
-    )
-    logging.warning("\n".join(check_results["missing_domain"]))
+    if check_results["missing_range"]:
+        issues_found = True
+        logger.warning("=== MISSING RANGE ===")
+        logger.warning(
+            "Properties in your namespace lack an rdfs:range. Add range declarations to constrain expected value types."
+        )
+        logger.warning("\n".join(check_results["missing_range"]))
 
-if check_results["missing_range"]:
-    issues_found = True
-    logging.warning("=== MISSING RANGE ===")
-    logging.warning(
-        "Properties in your namespace lack an rdfs:range. Add range declarations to constrain expected value types."
-    )
-    logging.warning("\n".join(check_results["missing_range"]))
+    if check_results["unionof_issues"]:
+        issues_found = True
+        logger.warning("=== MALFORMED UNIONOF ===")
+        logger.warning(
+            "Some owl:unionOf expressions in your ontology are incomplete RDF lists. Ensure they include rdf:first/rest/nil."
+        )
+        logger.warning(
+            "\n".join(f"{s} -> {u}" for s, u in check_results["unionof_issues"])
+        )
 
-if check_results["unionof_issues"]:
-    issues_found = True
-    logging.warning("=== MALFORMED UNIONOF ===")
-    logging.warning(
-        "Some owl:unionOf expressions in your ontology are incomplete RDF lists. Ensure they include rdf:first/rest/nil."
-    )
-    for s, u in check_results["unionof_issues"]:
-        logging.warning(f"{s} -> {u}")
-
-if check_results["isolated_classes"]:
-    issues_found = True
-    logging.warning("=== ISOLATED CLASSES ===")
-    logging.warning(
-        "These classes are not connected to any properties or subclass relations. Review if they should be linked or removed."
-    )
-    logging.warning("\n".join(check_results["isolated_classes"]))
-
-# if check_results["missing_inverses"]:
-#     issues_found = True
-#     logging.warning("=== MISSING INVERSEOF ===")
-#     logging.warning(
-#         "These object properties lack owl:inverseOf definitions. Adding inverses improves querying and reasoning consistency."
-#     )
-#     logging.warning("\n".join(check_results["missing_inverses"]))
-
-if check_results["unreachable"]:
-    issues_found = True
-    logging.warning("=== UNREACHABLE CLASSES ===")
-    logging.warning(
-        "These classes are not reachable via rdfs:subClassOf chains from owl:Thing or a STIX class. Consider linking or reclassifying them."
-    )
-    logging.warning("\n".join(check_results["unreachable"]))
+    if check_results["isolated_classes"]:
+        issues_found = True
+        logger.warning("=== ISOLATED CLASSES ===")
+        logger.warning(
+            "These classes are not connected to any properties or subclass relations. Review if they should be linked or removed."
+        )
+        logger.warning("\n".join(check_results["isolated_classes"]))
+
+    # if check_results["missing_inverses"]:
+    #     issues_found = True
+    #     logger.warning("=== MISSING INVERSEOF ===")
+    #     logger.warning(
+    #         "These object properties lack owl:inverseOf definitions. Adding inverses improves querying and reasoning consistency."
+    #     )
+    #     logger.warning("\n".join(check_results["missing_inverses"]))
+
+    if check_results["unreachable"]:
+        issues_found = True
+        logger.warning("=== UNREACHABLE CLASSES ===")
+        logger.warning(
+            "These classes are not reachable via rdfs:subClassOf chains from owl:Thing or a STIX class. Consider linking or reclassifying them."
+        )
+        logger.warning("\n".join(check_results["unreachable"]))
 
-if check_results["subclass_cycles"]:
-    issues_found = True
-    logging.warning("=== SUBCLASS CYCLES ===")
-    logging.warning(
-        "Cycles in rdfs:subClassOf hierarchy were found. These may confuse OWL reasoners. Break the cycle if unintentional."
-    )
-    for cycle in check_results["subclass_cycles"]:
-        logging.warning(" -> ".join(cycle))
-
-if check_results["undeclared_props"]:
-    issues_found = True
-    logging.warning("=== UNDECLARED PROPERTIES ===")
-    logging.warning(
-        "These properties are used in your namespace but never declared. Declare them as rdf/OWL properties."
-    )
-    logging.warning("\n".join(check_results["undeclared_props"]))
+    if check_results["subclass_cycles"]:
+        issues_found = True
+        logger.warning("=== SUBCLASS CYCLES ===")
+        logger.warning(
+            "Cycles in rdfs:subClassOf hierarchy were found. These may confuse OWL reasoners. Break the cycle if unintentional."
+        )
+        logger.warning(
+            "\n".join(" -> ".join(cycle) for cycle in check_results["subclass_cycles"])
+        )
 
-if check_results["disjoint_violations"]:
-    issues_found = True
-    logging.warning("=== DISJOINT VIOLATIONS ===")
-    logging.warning(
-        "Instances were found that belong to disjoint classes. This violates OWL DL semantics and should be corrected."
-    )
-    for inst, a, b in check_results["disjoint_violations"]:
-        logging.warning(f"{inst} has both {a} and {b}")
-
-if check_results["missing_labels"]:
-    issues_found = True
-    logging.warning("=== MISSING LABELS ===")
-    logging.warning(
-        "These ontology entities are missing rdfs:label annotations. Add labels to improve readability and tooling support."
-    )
-    logging.warning("\n".join(check_results["missing_labels"]))
+    if check_results["undeclared_props"]:
+        issues_found = True
+        logger.warning("=== UNDECLARED PROPERTIES ===")
+        logger.warning(
+            "These properties are used in your namespace but never declared. Declare them as rdf/OWL properties."
+        )
+        logger.warning("\n".join(check_results["undeclared_props"]))
 
-if check_results["non_snake_labels"]:
-    issues_found = True
-    logging.warning("=== INVALID TECHNICAL NAMES ===")
-    logging.warning(
-        "These ontology entities have rdfs:label values that don't follow technical naming conventions (allow letters, numbers, underscores)."
-    )
-    logging.warning("\n".join(check_results["non_snake_labels"]))
-
-# New strict naming convention reporting
-if check_results["class_uri_violations"]:
-    issues_found = True
-    logging.warning("=== CLASS URI NAMING VIOLATIONS ===")
-    logging.warning(
-        "These class URIs don't follow kebab-case convention. Class rdf:about URIs should use hyphens (e.g., 'generation-asset')."
-    )
-    logging.warning("\n".join(check_results["class_uri_violations"]))
+    if check_results["disjoint_violations"]:
+        issues_found = True
+        logger.warning("=== DISJOINT VIOLATIONS ===")
+        logger.warning(
+            "Instances were found that belong to disjoint classes. This violates OWL DL semantics and should be corrected."
+        )
+        logger.warning(
+            "\n".join(
+                f"{inst} has both {a} and {b}"
+                for inst, a, b in check_results["disjoint_violations"]
+            )
+        )
 
-if check_results["property_uri_violations"]:
-    issues_found = True
-    logging.warning("=== PROPERTY URI NAMING VIOLATIONS ===")
-    logging.warning(
-        "These property URIs don't follow kebab-case convention. Property rdf:about URIs should use hyphens (e.g., 'has-component')."
-    )
-    logging.warning("\n".join(check_results["property_uri_violations"]))
+    if check_results["missing_labels"]:
+        issues_found = True
+        logger.warning("=== MISSING LABELS ===")
+        logger.warning(
+            "These ontology entities are missing rdfs:label annotations. Add labels to improve readability and tooling support."
+        )
+        logger.warning("\n".join(check_results["missing_labels"]))
 
-if check_results["label_violations"]:
-    issues_found = True
-    logging.warning("=== LABEL NAMING VIOLATIONS ===")
-    logging.warning(
-        "These rdfs:label values don't follow snake_case convention. Labels should use underscores (e.g., 'generation_asset')."
-    )
-    logging.warning("\n".join(check_results["label_violations"]))
-
-# STIX 2.1 compliance issue reporting
-if check_results["stix_inheritance"]:
-    issues_found = True
-    logging.warning("=== STIX INHERITANCE NON-COMPLIANCE ===")
-    logging.warning(
-        "These classes do not properly inherit from STIX base classes. Ensure all Grid-STIX classes inherit from appropriate STIX classes."
-    )
-    logging.warning("\n".join(check_results["stix_inheritance"]))
+    if check_results["non_snake_labels"]:
+        issues_found = True
+        logger.warning("=== INVALID TECHNICAL NAMES ===")
+        logger.warning(
+            "These ontology entities have rdfs:label values that don't follow technical naming conventions (allow letters, numbers, underscores)."
+        )
+        logger.warning("\n".join(check_results["non_snake_labels"]))
+
+    # New strict naming convention reporting
+    if check_results["class_uri_violations"]:
+        issues_found = True
+        logger.warning("=== CLASS URI NAMING VIOLATIONS ===")
+        logger.warning(
+            "These class URIs don't follow kebab-case convention. Class rdf:about URIs should use hyphens (e.g., 'generation-asset')."
+        )
+        logger.warning("\n".join(check_results["class_uri_violations"]))
 
-if check_results["stix_namespace"]:
-    issues_found = True
-    logging.warning("=== STIX NAMESPACE INCONSISTENCY ===")
-    logging.warning(
-        "These references use incorrect STIX namespace formats. Update to use proper STIX 2.1 namespace patterns."
-    )
-    logging.warning("\n".join(check_results["stix_namespace"]))
+    if check_results["property_uri_violations"]:
+        issues_found = True
+        logger.warning("=== PROPERTY URI NAMING VIOLATIONS ===")
+        logger.warning(
+            "These property URIs don't follow kebab-case convention. Property rdf:about URIs should use hyphens (e.g., 'has-component')."
+        )
+        logger.warning("\n".join(check_results["property_uri_violations"]))
 
-if check_results["stix_properties"]:
-    issues_found = True
-    logging.warning("=== GRID-STIX PROPERTY NAMING NON-COMPLIANCE ===")
-    logging.warning(
-        "These properties do not follow Grid-STIX naming conventions. Property URIs should use kebab-case (hyphens)."
-    )
-    logging.warning("\n".join(check_results["stix_properties"]))
+    if check_results["label_violations"]:
+        issues_found = True
+        logger.warning("=== LABEL NAMING VIOLATIONS ===")
+        logger.warning(
+            "These rdfs:label values don't follow snake_case convention. Labels should use underscores (e.g., 'generation_asset')."
+        )
+        logger.warning("\n".join(check_results["label_violations"]))
+
+    # STIX 2.1 compliance issue reporting
+    if check_results["stix_inheritance"]:
+        issues_found = True
+        logger.warning("=== STIX INHERITANCE NON-COMPLIANCE ===")
+        logger.warning(
+            "These classes do not properly inherit from STIX base classes. Ensure all Grid-STIX classes inherit from appropriate STIX classes."
+        )
+        logger.warning("\n".join(check_results["stix_inheritance"]))
 
-if check_results["stix_relationships"]:
-    issues_found = True
-    logging.warning("=== STIX RELATIONSHIP NON-COMPLIANCE ===")
-    logging.warning(
-        "These relationship classes do not properly inherit from STIX Relationship base class."
-    )
-    logging.warning("\n".join(check_results["stix_relationships"]))
+    if check_results["stix_namespace"]:
+        issues_found = True
+        logger.warning("=== STIX NAMESPACE INCONSISTENCY ===")
+        logger.warning(
+            "These references use incorrect STIX namespace formats. Update to use proper STIX 2.1 namespace patterns."
+        )
+        logger.warning("\n".join(check_results["stix_namespace"]))
 
-if check_results["stix_vocabularies"]:
-    issues_found = True
-    logging.warning("=== STIX VOCABULARY NON-COMPLIANCE ===")
-    logging.warning(
-        "These vocabulary classes have issues with their STIX vocabulary patterns."
-    )
-    logging.warning("\n".join(check_results["stix_vocabularies"]))
+    if check_results["stix_properties"]:
+        issues_found = True
+        logger.warning("=== GRID-STIX PROPERTY NAMING NON-COMPLIANCE ===")
+        logger.warning(
+            "These properties do not follow Grid-STIX naming conventions. Property URIs should use kebab-case (hyphens)."
+        )
+        logger.warning("\n".join(check_results["stix_properties"]))
 
-if check_results["stix_required_properties"]:
-    issues_found = True
-    logging.warning("=== STIX REQUIRED PROPERTIES MISSING ===")
-    logging.warning(
-        "These relationship classes are missing required source_ref or target_ref restrictions."
-    )
-    logging.warning("\n".join(check_results["stix_required_properties"]))
+    if check_results["stix_relationships"]:
+        issues_found = True
+        logger.warning("=== STIX RELATIONSHIP NON-COMPLIANCE ===")
+        logger.warning(
+            "These relationship classes do not properly inherit from STIX Relationship base class."
+        )
+        logger.warning("\n".join(check_results["stix_relationships"]))
 
-if check_results["unresolved_types"]:
-    issues_found = True
-    logging.warning("=== UNRESOLVED TYPE REFERENCES ===")
-    logging.warning(
-        "These properties have domain/range references that don't resolve to defined classes or valid types."
-    )
-    logging.warning("\n".join(check_results["unresolved_types"]))
+    if check_results["stix_vocabularies"]:
+        issues_found = True
+        logger.warning("=== STIX VOCABULARY NON-COMPLIANCE ===")
+        logger.warning(
+            "These vocabulary classes have issues with their STIX vocabulary patterns."
+        )
+        logger.warning("\n".join(check_results["stix_vocabularies"]))
+
+    if check_results["stix_required_properties"]:
+        issues_found = True
+        logger.warning("=== STIX REQUIRED PROPERTIES MISSING ===")
+        logger.warning(
+            "These relationship classes are missing required source_ref or target_ref restrictions."
+        )
+        logger.warning("\n".join(check_results["stix_required_properties"]))
 
-if not issues_found:
-    logging.info("No issues found in the ontology.")
-else:
-    logging.error("Issues were found in the ontology. Please review and fix them.")
+    if check_results["unresolved_types"]:
+        issues_found = True
+        logger.warning("=== UNRESOLVED TYPE REFERENCES ===")
+        logger.warning(
+            "These properties have domain/range references that don't resolve to defined classes or valid types."
+        )
+        logger.warning("\n".join(check_results["unresolved_types"]))
 
-if __name__ == "__main__":
-    # Parse command line arguments when run as script
-    args = parse_arguments()
+    if not issues_found:
+        logger.info("No issues found in the ontology.")
+    else:
+        logger.error("Issues were found in the ontology. Please review and fix them.")
+
+    return issues_found
+
+
+def main() -> int:
+    """Command line entry point; returns 1 if the ontology has issues"""
+    global OWL_FILE, BASE_NAMESPACE, CATALOG_FILE, SKIP_CHECKS, NT_CACHE_DIR
 
     # Update configuration with parsed arguments
+    args = parse_arguments()
     OWL_FILE = args.owl_file
     BASE_NAMESPACE = args.base_namespace
     CATALOG_FILE = args.catalog
     SKIP_CHECKS = args.skip_checks
+    NT_CACHE_DIR = args.nt_cache_dir
+
+    try:
+        graph = load_ontology(OWL_FILE, CATALOG_FILE, BASE_NAMESPACE)
+    except Exception as e:
+        logger.info(f"FATAL: Error parsing main ontology file {OWL_FILE}: {e}")
+        return 1
+
+    check_results = run_checks(graph, SKIP_CHECKS)
 
     # Set exit code based on whether issues were found
-    sys.exit(1 if issues_found else 0)
+    return 1 if report_issues(check_results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
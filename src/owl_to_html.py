@@ -1,12 +1,29 @@
 import argparse
+import hashlib
+import json
+import multiprocessing
 import networkx as nx
 import networkx.drawing.nx_agraph as nx_agraph
+import numpy as np
 import os
-import plotly.graph_objects as go
-from typing import Any, Union
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import chain
+from jinja2 import Environment, FileSystemLoader
+from pathlib import Path
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from rdflib import BNode, Graph, RDF, RDFS, OWL
 
+try:  # optional: native JSON encoder for the figure payload
+    import orjson
+except ImportError:
+    orjson = None
+
 # Constants
 STIX_BASE = "http://docs.oasis-open.org/ns/cti/stix"
 CTI_BASE = "http://docs.oasis-open.org/ns/cti"
@@ -48,144 +65,661 @@ COLOR_SCHEME = {
 
 DEFAULT_NODE_COLOR = "black"
 
+# rdflib parser for each input file extension; anything else is RDF/XML
+RDF_FORMATS = {
+    ".ttl": "turtle",
+    ".nt": "nt",
+    ".nq": "nquads",
+    ".owl": "xml",
+    ".rdf": "xml",
+}
+
+# Page template for the generated HTML, next to this script
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+GRAPH_TITLE = "Grid-STIX 2.1 Electrical Grid Cybersecurity Ontology"
+
+# Extra hover context for node types with a Grid-STIX category
+NODE_CATEGORIES = {
+    "OTDevice": "Operational Technology",
+    "GridComponent": "Electrical Grid Equipment",
+    "Supplier": "Supply Chain Entity",
+    "Attack": "Threat Pattern",
+    "Protection": "Protective System",
+    "PowerFlow": "Electrical Flow",
+    "Protocol": "Communication Protocol",
+}
+
+# Properties hidden by --no-common-properties contain one of these keywords
+COMMON_PROPERTY_KEYWORDS = ("ref", "type", "status")
+
+# Node types always kept when --max-nodes trims the graph; the other types
+# start hidden behind their legend entries
+PRIORITY_NODE_TYPES = {"Asset", "Event", "Component", "Attack", "Vulnerability"}
+
+# Node types kept by each --focus-* option; with several, a node must match all
+FOCUS_NODE_TYPES = {
+    "focus_infrastructure": {
+        "Asset",
+        "Component",
+        "OTDevice",
+        "GridComponent",
+        "Sensor",
+    },
+    "focus_security": {"Attack", "Vulnerability", "Mitigation", "Event", "Policy"},
+    "focus_supply_chain": {"Supplier", "SupplyChainRisk"},
+}
+
+# Object properties are labelled in worker processes above this count, in
+# chunks of PROPERTY_CHUNK_SIZE
+PARALLEL_PROPERTY_THRESHOLD = 2000
+PROPERTY_CHUNK_SIZE = 256
+
+# Graphs with more nodes than this default to the sfdp layout, which scales
+# far better than dot on large inputs
+LARGE_GRAPH_NODES = 2000
+
+# Components this small are placed directly instead of spawning a Graphviz
+# process for each of them
+TRIVIAL_COMPONENT_NODES = 2
+
+# Vertical spacing of directly placed nodes, in Graphviz points (-Granksep=3.0)
+# and in spring layout units
+RANK_SPACING = {"graphviz": 216.0, "spring": 1.0}
+
+# Where --layout cached stores computed node positions
+LAYOUT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "grid-stix")
+
+# Above this many edges, hover markers for edge labels are skipped and edges
+# are drawn with WebGL (Scattergl) instead of SVG.
+EDGE_LABEL_THRESHOLD = 500
+
+# Edge labels used at least this many times get their own hover marker trace
+# carrying the label once instead of once per edge
+SHARED_EDGE_LABEL_MIN = 10
+
+# Above this many nodes plus edges, every trace is drawn with WebGL since the
+# browser slows to a crawl with one SVG element per point
+WEBGL_THRESHOLD = 1500
+
 
 def get_label(uri: Union[str, BNode, Any]) -> str:
     """Extract a human-readable label from a URI."""
     if isinstance(uri, BNode):
-        return f"_anon_{str(uri)[:8]}"
-    uri = str(uri)
-    if "#" in uri:
-        return str(uri.split("#")[-1])
+        # Blank nodes are numerous and rarely repeated, so they bypass the cache
+        return f"_anon_{uri[:8]}"
+    return _uri_label(uri)
+
+
+@lru_cache(maxsize=None)
+def _uri_label(uri: Any) -> str:
+    """Label for a non-blank URI, memoized since edges revisit the same URIs."""
+    # rdflib terms are str subclasses and need no str() copy
+    if not isinstance(uri, str):
+        uri = str(uri)
+    _, sep, fragment = uri.rpartition("#")
+    if sep:
+        return fragment
     elif "/" in uri:
-        return str(uri.rstrip("/").split("/")[-1])
+        return uri.rstrip("/").rpartition("/")[2]
     else:
-        return str(uri[:12])
+        return uri[:12]
+
+
+# Namespace names by base URI, most specific first since STIX URIs also
+# start with the CTI base
+NAMESPACE_BASES = ((STIX_BASE, "STIX"), (CTI_BASE, "CTI"), (GRID_BASE, "Grid"))
+_KNOWN_NAMESPACES = tuple(base for base, _ in NAMESPACE_BASES)
+
+
+def namespace_of(uri: Union[str, BNode, Any]) -> str:
+    """Name of the namespace a URI belongs to: STIX, CTI, Grid or Other."""
+    uri_str = uri if isinstance(uri, str) else str(uri)
+    # One tuple startswith rejects most URIs before the per-base checks.
+    # str.startswith is called directly since rdflib terms override
+    # startswith with a version that does not accept tuples.
+    if str.startswith(uri_str, _KNOWN_NAMESPACES):
+        for base, name in NAMESPACE_BASES:
+            if str.startswith(uri_str, base):
+                return name
+    return "Other"
 
 
 def is_stix(uri: Union[str, BNode, Any]) -> bool:
     """Check if a URI is from the STIX namespace."""
-    return str(uri).startswith(STIX_BASE)
+    return str.startswith(uri if isinstance(uri, str) else str(uri), STIX_BASE)
 
 
 def is_cti(uri: Union[str, BNode, Any]) -> bool:
     """Check if a URI is from the CTI namespace."""
-    return str(uri).startswith(CTI_BASE)
+    return str.startswith(uri if isinstance(uri, str) else str(uri), CTI_BASE)
 
 
 def is_grid(uri: Union[str, BNode, Any]) -> bool:
     """Check if a URI is from the Grid-STIX namespace."""
-    return str(uri).startswith(GRID_BASE)
+    return str.startswith(uri if isinstance(uri, str) else str(uri), GRID_BASE)
 
 
-def get_node_type(label: str, g: Graph, uri: Union[str, BNode, Any]) -> str:
-    """Determine the type of a node based on its label or properties with Grid-STIX specific categorization."""
+# Label keywords for get_node_type, in priority order: when a label contains
+# keywords of several types, the earliest entry wins
+NODE_TYPE_KEYWORDS = [
+    ("Supplier", ("supplier", "supply_chain")),
+    ("OTDevice", ("ot_device", "otdevice", "rtu", "plc", "ied", "hmi", "smart_meter")),
+    (
+        "GridComponent",
+        (
+            "grid_component",
+            "gridcomponent",
+            "transformer",
+            "capacitor",
+            "voltage_regulator",
+            "circuit_breaker",
+            "recloser",
+            "sectionalizer",
+        ),
+    ),
+    ("Sensor", ("sensor",)),
+    ("Asset", ("asset", "device")),
+    ("Component", ("component",)),
+    ("Mitigation", ("mitigation",)),
+    ("Attack", ("attack", "pattern")),
+    ("Vulnerability", ("vulnerability",)),
+    ("Event", ("event",)),
+    ("Context", ("context",)),
+    ("Observable", ("observable",)),
+    ("Telemetry", ("telemetry", "monitoring")),
+    ("Relationship", ("relationship",)),
+    ("Policy", ("policy",)),
+    ("Protocol", ("protocol", "dnp3", "modbus", "iec", "opc", "ieee")),
+    ("PowerFlow", ("feeds_power", "power_flow", "electrical")),
+    ("Protection", ("protects", "protection", "protective")),
+    ("Control", ("controls", "control", "regulates", "regulation")),
+]
+
+# Parent-class label keywords used when a node's own label matches nothing
+PARENT_TYPE_KEYWORDS = [
+    ("OTDevice", ("otdevice",)),
+    ("GridComponent", ("gridcomponent",)),
+    ("Asset", ("asset",)),
+    ("Component", ("component",)),
+    ("Event", ("event",)),
+    ("Context", ("context",)),
+    ("Relationship", ("relationship",)),
+    ("Observable", ("observable",)),
+    ("Supplier", ("supplier",)),
+]
+
+
+def _compile_keyword_scan(table: List[Tuple[str, Tuple[str, ...]]]) -> Tuple[Any, Any]:
+    """Build a scanner that finds every keyword of table in a single regex pass
+
+    The lookahead lets matches overlap, and alternatives are listed in priority
+    order, so the lowest-ranked keyword found is the first matching table entry.
+    """
+    rank: Dict[str, Tuple[int, str]] = {}
+    for priority, (node_type, keywords) in enumerate(table):
+        for keyword in keywords:
+            rank.setdefault(keyword, (priority, node_type))
+    alternation = "|".join(re.escape(keyword) for keyword in rank)
+    return re.compile(f"(?=({alternation}))").findall, rank.__getitem__
+
+
+_find_node_keywords, _node_keyword_rank = _compile_keyword_scan(NODE_TYPE_KEYWORDS)
+_find_parent_keywords, _parent_keyword_rank = _compile_keyword_scan(
+    PARENT_TYPE_KEYWORDS
+)
+
+
+def classify_label(label_lc: str) -> Optional[str]:
+    """Node type implied by keywords in a lowercase label, or None if none match"""
+    found = _find_node_keywords(label_lc)
+    if not found:
+        return None
+    node_type = min(map(_node_keyword_rank, found))[1]
+    if node_type == "Supplier" and "risk" in label_lc:
+        return "SupplyChainRisk"
+    return node_type
+
+
+@dataclass
+class OntologyIndex:
+    """Classes, object properties and the triples the visualization reads"""
+
+    explicit_classes: Set[Any] = field(default_factory=set)
+    object_properties: Set[Any] = field(default_factory=set)
+    domains: Dict[Any, List[Any]] = field(default_factory=lambda: defaultdict(list))
+    ranges: Dict[Any, List[Any]] = field(default_factory=lambda: defaultdict(list))
+    # Domains and ranges without blank nodes (e.g. unionOf), for edges
+    named_domains: Dict[Any, List[Any]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    named_ranges: Dict[Any, List[Any]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    subclass_pairs: List[Tuple[Any, Any]] = field(default_factory=list)
+    # Everything drawn as a node: explicit classes plus the named domain and
+    # range of each object property
+    node_uris: Set[Any] = field(default_factory=set)
+
+
+def build_ontology_index(g: Graph) -> OntologyIndex:
+    """Read each predicate the visualization needs exactly once.
+
+    Each scan goes through the store's predicate index, which touches only
+    matching triples and is cheaper than one pass over the whole graph.
+    """
+    index = OntologyIndex()
+    for subject, _, rdf_type in g.triples((None, RDF.type, None)):
+        if isinstance(subject, BNode):
+            continue
+        if rdf_type == OWL.Class:
+            index.explicit_classes.add(subject)
+        elif rdf_type == OWL.ObjectProperty:
+            index.object_properties.add(subject)
+
+    for s, _, o in g.triples((None, RDFS.domain, None)):
+        index.domains[s].append(o)
+        if not isinstance(o, BNode):
+            index.named_domains[s].append(o)
+    for s, _, o in g.triples((None, RDFS.range, None)):
+        index.ranges[s].append(o)
+        if not isinstance(o, BNode):
+            index.named_ranges[s].append(o)
+
+    index.node_uris = set(index.explicit_classes)
+    for prop in index.object_properties:
+        for ends in (index.domains, index.ranges):
+            end = next(iter(ends.get(prop, ())), None)
+            if end and not isinstance(end, BNode):
+                index.node_uris.add(end)
+
+    index.subclass_pairs = [
+        (s, o) for s, _, o in g.triples((None, RDFS.subClassOf, None))
+    ]
+    return index
+
+
+def build_inherited_types(
+    g: Graph, index: Optional[OntologyIndex] = None
+) -> Dict[Any, str]:
+    """Map each subclass to the type named by its nearest matching ancestor.
+
+    Ancestors are searched breadth-first over rdfs:subClassOf, so a direct
+    parent whose label carries a type keyword wins over any grandparent,
+    and parents are tried in triple order.
+    """
+    if index is not None:
+        pairs = index.subclass_pairs
+    else:
+        pairs = ((s, o) for s, _, o in g.triples((None, RDFS.subClassOf, None)))
+    parents: Dict[Any, List[Any]] = defaultdict(list)
+    for s, o in pairs:
+        parents[s].append(o)
+
+    keyword_types: Dict[Any, Optional[str]] = {}
+
+    def keyword_type(uri: Any) -> Optional[str]:
+        if uri not in keyword_types:
+            found = _find_parent_keywords(get_label(uri).lower())
+            keyword_types[uri] = (
+                min(map(_parent_keyword_rank, found))[1] if found else None
+            )
+        return keyword_types[uri]
+
+    inherited_types: Dict[Any, str] = {}
+    for cls, direct_parents in parents.items():
+        seen = {cls}
+        level = direct_parents
+        while level and cls not in inherited_types:
+            next_level = []
+            for ancestor in level:
+                if ancestor in seen:
+                    continue
+                seen.add(ancestor)
+                node_type = keyword_type(ancestor)
+                if node_type is not None:
+                    inherited_types[cls] = node_type
+                    break
+                next_level.extend(parents.get(ancestor, ()))
+            level = next_level
+    return inherited_types
+
+
+def get_node_type(
+    label_lc: str,
+    uri: Union[str, BNode, Any],
+    inherited_types: Dict[Any, str],
+    namespace: Optional[str] = None,
+) -> str:
+    """Determine the type of a node based on its label or properties with Grid-STIX specific categorization.
+
+    label_lc is the node's lowercase label and inherited_types comes from
+    build_inherited_types, so classifying a node never queries the graph.
+    namespace is namespace_of(uri), if the caller already has it.
+    """
     if isinstance(uri, BNode):
         return "Anonymous"
 
-    label = str(label).lower()
-    uri_str = str(uri).lower()
+    node_type = classify_label(label_lc)
+    if node_type is not None:
+        return node_type
 
-    # Grid-STIX specific type detection
+    # Check if it's a STIX concept
+    if namespace is None:
+        namespace = namespace_of(uri)
+    if namespace in ("STIX", "CTI"):
+        return namespace
 
-    # Supply Chain Security
-    if "supplier" in label or "supply_chain" in label:
-        return "Supplier" if "risk" not in label else "SupplyChainRisk"
+    # Fall back to the type inherited from the nearest typed ancestor
+    return inherited_types.get(uri, "Other")
 
-    # Grid Infrastructure - More specific categorization
-    if (
-        "ot_device" in label
-        or "otdevice" in label
-        or any(x in label for x in ["rtu", "plc", "ied", "hmi", "smart_meter"])
-    ):
-        return "OTDevice"
-    elif (
-        "grid_component" in label
-        or "gridcomponent" in label
-        or any(
-            x in label
-            for x in [
-                "transformer",
-                "capacitor",
-                "voltage_regulator",
-                "circuit_breaker",
-                "recloser",
-                "sectionalizer",
-            ]
+
+def interleave_segments(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Lay out line segments as start, end, NaN triples for a single Plotly trace
+
+    Plotly breaks a line at NaN, so each segment is drawn separately.
+    """
+    coords = np.full(len(start) * 3, np.nan)
+    coords[0::3] = start
+    coords[1::3] = end
+    return coords
+
+
+def _label_properties(
+    items: List[Tuple[Any, List[Any], List[Any]]],
+    skip_common_properties: bool = False,
+) -> List[Tuple[str, List[str], List[str]]]:
+    """Label (property, domains, ranges) items, dropping filtered properties"""
+    labelled = []
+    for prop, domain_uris, range_uris in items:
+        prop_label = get_label(prop)
+
+        # Apply --no-common-properties filter if present and active
+        if skip_common_properties:
+            prop_label_lc = prop_label.lower()
+            if any(keyword in prop_label_lc for keyword in COMMON_PROPERTY_KEYWORDS):
+                continue
+
+        labelled.append(
+            (
+                prop_label,
+                [get_label(uri) for uri in domain_uris],
+                [get_label(uri) for uri in range_uris],
+            )
         )
+    return labelled
+
+
+def label_properties(
+    items: List[Tuple[Any, List[Any], List[Any]]],
+    skip_common_properties: bool = False,
+    parallel: bool = True,
+) -> List[Tuple[str, List[str], List[str]]]:
+    """Label object properties with their domains and ranges, in order.
+
+    Large property sets are split into chunks that worker processes label
+    independently. Items are plain URI tuples, so workers never touch the
+    rdflib store.
+    """
+    if (
+        parallel
+        and len(items) > PARALLEL_PROPERTY_THRESHOLD
+        and "fork" in multiprocessing.get_all_start_methods()
     ):
-        return "GridComponent"
-    elif "sensor" in label:
-        return "Sensor"
-    elif "asset" in label or "device" in label:
-        return "Asset"
-    elif "component" in label:
-        return "Component"
-
-    # Security & Threats
-    elif "attack" in label or "pattern" in label or "mitigation" in label:
-        return "Mitigation" if "mitigation" in label else "Attack"
-    elif "vulnerability" in label:
-        return "Vulnerability"
-
-    # Operations & Monitoring
-    elif "event" in label:
-        return "Event"
-    elif "context" in label:
-        return "Context"
-    elif "observable" in label:
-        return "Observable"
-    elif "telemetry" in label or "monitoring" in label:
-        return "Telemetry"
-
-    # Relationships & Policies
-    elif "relationship" in label:
-        return "Relationship"
-    elif "policy" in label:
-        return "Policy"
-
-    # Protocols
-    elif "protocol" in label or any(
-        x in label for x in ["dnp3", "modbus", "iec", "opc", "ieee"]
-    ):
-        return "Protocol"
+        chunks = [
+            items[i : i + PROPERTY_CHUNK_SIZE]
+            for i in range(0, len(items), PROPERTY_CHUNK_SIZE)
+        ]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(len(chunks), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                worker = partial(
+                    _label_properties, skip_common_properties=skip_common_properties
+                )
+                return list(chain.from_iterable(executor.map(worker, chunks)))
+        except Exception as e:
+            print(f"Warning: parallel property labelling failed, running serially: {e}")
+    return _label_properties(items, skip_common_properties)
+
+
+def _layout_graph(
+    graph: nx.DiGraph, layout: str, root_node: Optional[str] = None
+) -> Dict[str, Tuple[float, float]]:
+    """Run a single layout program over the whole of graph"""
+    if layout == "spring":
+        # Uses the scipy sparse Fruchterman-Reingold solver when available
+        return nx.spring_layout(graph, k=3, iterations=50, seed=0)
+    layout_args = "-Granksep=3.0 -Gnodesep=2.0"
+    if root_node and layout in ["dot", "twopi"]:
+        layout_args += f" -Groot={root_node}"
+    return nx_agraph.graphviz_layout(graph, prog=layout, args=layout_args)
+
+
+def _place_trivial(graph: nx.DiGraph, layout: str) -> Dict[str, Tuple[float, float]]:
+    """Stack the nodes of a tiny component top-down, sources first, as dot would"""
+    spacing = RANK_SPACING["spring" if layout == "spring" else "graphviz"]
+    order = sorted(graph, key=graph.in_degree)
+    return {node: (0.0, -i * spacing) for i, node in enumerate(order)}
+
+
+def _place_leaves(
+    pos: Dict[str, Tuple[float, float]],
+    leaf_parents: Dict[str, str],
+    radius: float,
+) -> None:
+    """Spread collapsed leaves evenly on a circle around their parent node"""
+    siblings = defaultdict(list)
+    for leaf, parent in leaf_parents.items():
+        siblings[parent].append(leaf)
+    for parent, leaves in siblings.items():
+        px, py = pos[parent]
+        angles = np.linspace(0.0, 2 * np.pi, len(leaves), endpoint=False)
+        for leaf, angle in zip(leaves, angles):
+            pos[leaf] = (px + radius * np.cos(angle), py + radius * np.sin(angle))
+
+
+def _pack_components(
+    layouts: List[Dict[str, Tuple[float, float]]],
+) -> Dict[str, Tuple[float, float]]:
+    """Translate separately laid out components into rows, largest first"""
+    boxes = []
+    for pos in layouts:
+        coords = np.array(list(pos.values()), dtype=np.float64).reshape(-1, 2)
+        boxes.append((coords.min(axis=0), coords.max(axis=0)))
+    sizes = [hi - lo for lo, hi in boxes]
+    pad = max(0.1 * float(max(sizes[0])), 1.0)
+    row_width = max(
+        float(sizes[0][0]),
+        float(np.sqrt(sum((w + pad) * (h + pad) for w, h in sizes))),
+    )
 
-    # Power System Specific
-    elif any(x in label for x in ["feeds_power", "power_flow", "electrical"]):
-        return "PowerFlow"
-    elif any(x in label for x in ["protects", "protection", "protective"]):
-        return "Protection"
-    elif any(x in label for x in ["controls", "control", "regulates", "regulation"]):
-        return "Control"
+    packed = {}
+    cursor_x = cursor_y = row_height = 0.0
+    for pos, (lo, hi), (width, height) in zip(layouts, boxes, sizes):
+        if cursor_x and cursor_x + width > row_width:
+            cursor_x = 0.0
+            cursor_y -= row_height + pad
+            row_height = 0.0
+        dx, dy = cursor_x - lo[0], cursor_y - hi[1]
+        for node, (x, y) in pos.items():
+            packed[node] = (x + dx, y + dy)
+        cursor_x += width + pad
+        row_height = max(row_height, height)
+    return packed
+
+
+def compute_layout(
+    nxg: nx.DiGraph,
+    layout: str,
+    root_node: Optional[str] = None,
+    collapse_leaves: bool = False,
+) -> Dict[str, Tuple[float, float]]:
+    """Compute node positions with the named layout, falling back to spring.
+
+    Each weakly connected component is laid out on its own and the results
+    are packed side by side, which keeps the graphs handed to Graphviz small.
+    With collapse_leaves, degree-1 nodes are left out of the layout and placed
+    around their neighbour afterwards.
+    """
+    components = sorted(nx.weakly_connected_components(nxg), key=len, reverse=True)
+    layouts = []
+    for nodes in components:
+        component = nxg.subgraph(nodes)
+        leaf_parents = {}
+        if collapse_leaves and len(component) > 2:
+            leaf_parents = {
+                node: next(nx.all_neighbors(component, node))
+                for node, degree in component.degree()
+                if degree == 1
+            }
+            component = component.subgraph(set(component) - set(leaf_parents))
+
+        root = root_node if root_node in component else None
+        if len(component) <= TRIVIAL_COMPONENT_NODES:
+            pos = _place_trivial(component, layout)
+        else:
+            try:
+                pos = _layout_graph(component, layout, root)
+            except Exception:
+                # Fallback to spring layout if graphviz fails
+                print(f"Warning: {layout} layout failed, falling back to spring layout")
+                layout = "spring"
+                pos = _layout_graph(component, layout, root)
+        pos = {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+
+        if leaf_parents:
+            lengths = [
+                np.hypot(pos[u][0] - pos[v][0], pos[u][1] - pos[v][1])
+                for u, v in component.edges()
+            ]
+            if lengths:
+                radius = 0.5 * float(np.median(lengths))
+            else:
+                radius = 1.0 if layout == "spring" else 72.0
+            _place_leaves(pos, leaf_parents, radius)
+        layouts.append(pos)
+
+    if not layouts:
+        return {}
+    return _pack_components(layouts)
+
+
+def cached_layout(
+    nxg: nx.DiGraph,
+    layout: str,
+    root_node: Optional[str] = None,
+    collapse_leaves: bool = False,
+) -> Dict[str, Tuple[float, float]]:
+    """Load node positions for this exact graph from LAYOUT_CACHE_DIR, computing
+    and saving them with the given layout on a cache miss."""
+    key = hashlib.sha256(
+        repr(
+            (
+                layout,
+                root_node,
+                collapse_leaves,
+                sorted(map(str, nxg.nodes)),
+                sorted(nxg.edges),
+            )
+        ).encode("utf-8")
+    ).hexdigest()[:16]
+    cache_path = os.path.join(LAYOUT_CACHE_DIR, f"layout-{key}.npz")
+
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as cached:
+            return {
+                node: (float(x), float(y))
+                for node, (x, y) in zip(cached["nodes"].tolist(), cached["pos"])
+            }
+
+    pos = compute_layout(nxg, layout, root_node, collapse_leaves)
+    nodes = list(pos)
+    os.makedirs(LAYOUT_CACHE_DIR, exist_ok=True)
+    np.savez(
+        cache_path,
+        nodes=np.array(nodes, dtype=str),
+        pos=np.array([pos[node] for node in nodes], dtype=np.float64).reshape(-1, 2),
+    )
+    print(f"Layout cached to: {cache_path}")
+    return pos
+
+
+def _to_json(value: Any) -> str:
+    """Serialize figure data for embedding in a script tag"""
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+    if orjson is not None:
+        # orjson encodes contiguous arrays natively; it writes NaN as null,
+        # which Plotly also treats as a line break
+        text = orjson.dumps(
+            value, default=default, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    else:
+        # NaN (a line break in Plotly traces) is valid JavaScript
+        text = json.dumps(value, default=default, separators=(",", ":"))
+    # "</" is escaped so labels cannot close the surrounding script tag
+    return text.replace("</", "<\\/")
 
-    # Check if it's a STIX concept
-    if is_stix(uri):
-        return "STIX"
-    elif is_cti(uri):
-        return "CTI"
-
-    # Check parent classes for inheritance-based typing
-    for _, _, o in g.triples((uri, RDFS.subClassOf, None)):
-        parent_label = get_label(o).lower()
-        if "otdevice" in parent_label:
-            return "OTDevice"
-        elif "gridcomponent" in parent_label:
-            return "GridComponent"
-        elif "asset" in parent_label:
-            return "Asset"
-        elif "component" in parent_label:
-            return "Component"
-        elif "event" in parent_label:
-            return "Event"
-        elif "context" in parent_label:
-            return "Context"
-        elif "relationship" in parent_label:
-            return "Relationship"
-        elif "observable" in parent_label:
-            return "Observable"
-        elif "supplier" in parent_label:
-            return "Supplier"
 
-    return "Other"
+def write_html(
+    figure: Dict[str, Any],
+    output_path: str,
+    plotlyjs: str = "cdn",
+    full_html: bool = True,
+) -> None:
+    """Render a figure dict into the HTML page template.
+
+    The figure is dumped straight to JSON, bypassing plotly.graph_objects and
+    its per-element validation, and the page is streamed to output_path.
+    plotlyjs selects how plotly.js is loaded: "cdn" references the Plotly
+    CDN, "inline" embeds the bundled copy and "directory" writes
+    plotly.min.js next to the output and references it. Without full_html
+    only the graph div and its scripts are written, for embedding in
+    another page.
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=False,  # Template content is JSON inside a script tag
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    template = env.get_template("graph.html.j2")
+
+    if plotlyjs == "cdn":
+        plotlyjs_url = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+    elif plotlyjs == "directory":
+        plotlyjs_url = "plotly.min.js"
+        bundle_path = Path(output_path).parent / plotlyjs_url
+        if not bundle_path.exists():
+            bundle_path.write_text(get_plotlyjs(), encoding="utf-8")
+    elif plotlyjs == "inline":
+        plotlyjs_url = None
+    else:
+        raise ValueError(f"Unknown plotlyjs mode: {plotlyjs}")
+
+    stream = template.stream(
+        title=GRAPH_TITLE,
+        div_id="grid-stix-graph",
+        full_html=full_html,
+        plotlyjs=get_plotlyjs() if plotlyjs == "inline" else None,
+        plotlyjs_url=plotlyjs_url,
+        data_json=_to_json(figure["data"]),
+        layout_json=_to_json(figure["layout"]),
+        config_json=_to_json(
+            {"responsive": True, "displaylogo": False, "doubleClick": "reset"}
+        ),
+    )
+    with open(output_path, "w", encoding="utf-8") as f:
+        stream.dump(f)
 
 
 def convert_to_plotly_html(
@@ -193,131 +727,141 @@ def convert_to_plotly_html(
 ) -> None:
     """Convert an OWL ontology to a Plotly HTML network visualization."""
     g = Graph()
-    g.parse(owl_path)
-    nxg = nx.DiGraph()
+    # Name the format up front so rdflib skips format detection
+    extension = os.path.splitext(owl_path)[1].lower()
+    g.parse(owl_path, format=RDF_FORMATS.get(extension, "xml"))
+
+    # The graph is kept as plain index structures: node labels and types in
+    # insertion order, and edges keyed by (source, target) node index. Later
+    # edges between the same pair replace the label but keep a dashed style.
+    node_ids: List[str] = []
+    node_types: List[str] = []
+    id_of: Dict[str, int] = {}
+    edge_attrs: Dict[Tuple[int, int], Tuple[str, bool]] = {}
+
+    # Every rdflib query happens here, once per predicate
+    index = build_ontology_index(g)
+    object_properties = index.object_properties
+    named_domains, named_ranges = index.named_domains, index.named_ranges
+
+    # Inherited types are resolved once over the subclass hierarchy
+    inherited_types = build_inherited_types(g, index)
+
+    # Labels of the URIs actually added as nodes, reused for edge construction
+    uri_to_label = {}
+
+    # Filter settings are resolved once rather than per node or property
+    exclude_prefixes = (
+        tuple(args.exclude_prefix.split(",")) if args.exclude_prefix else ()
+    )
+    skip_common_properties = getattr(args, "no_common_properties", False)
+    grid_only = args.grid_only
+    focus_types = [
+        types for option, types in FOCUS_NODE_TYPES.items() if getattr(args, option)
+    ]
+    allowed_types = set.intersection(*focus_types) if focus_types else None
 
-    # Extract explicit classes and object properties
-    explicit_classes = {
-        cls for cls in g.subjects(RDF.type, OWL.Class) if not isinstance(cls, BNode)
-    }
-    object_properties = {
-        prop
-        for prop in g.subjects(RDF.type, OWL.ObjectProperty)
-        if not isinstance(prop, BNode)
-    }
-
-    # Gather all URIs that should be treated as nodes:
-    # explicit classes + non-BNode domains/ranges of object properties.
-    all_node_uris = set(explicit_classes)
-    for prop in object_properties:
-        domain_uri_for_prop = next(g.objects(prop, RDFS.domain), None)
-        range_uri_for_prop = next(g.objects(prop, RDFS.range), None)
-        if domain_uri_for_prop and not isinstance(domain_uri_for_prop, BNode):
-            all_node_uris.add(domain_uri_for_prop)
-        if range_uri_for_prop and not isinstance(range_uri_for_prop, BNode):
-            all_node_uris.add(range_uri_for_prop)
-
-    # Add nodes to nxg from the comprehensive set of URIs with Grid-STIX filtering
-    for node_uri in all_node_uris:  # Iterate over the new comprehensive set
+    # Add nodes from the comprehensive set of URIs with Grid-STIX filtering
+    for node_uri in index.node_uris:
         label = get_label(node_uri)
 
         # Apply prefix exclusion filter
-        if args.exclude_prefix and any(
-            label.startswith(prefix) for prefix in args.exclude_prefix.split(",")
-        ):
+        if exclude_prefixes and label.startswith(exclude_prefixes):
             continue
 
         # Apply Grid-STIX specific filters
-        if (
-            args.grid_only
-            and (is_stix(node_uri) or is_cti(node_uri))
-            and not is_grid(node_uri)
-        ):
+        namespace = namespace_of(node_uri)
+        if grid_only and namespace in ("STIX", "CTI"):
             continue  # Skip base STIX/CTI classes when showing grid-only
 
-        node_type = get_node_type(label, g, node_uri)
+        node_type = get_node_type(label.lower(), node_uri, inherited_types, namespace)
 
         # Apply focus filters
-        if args.focus_infrastructure and node_type not in [
-            "Asset",
-            "Component",
-            "OTDevice",
-            "GridComponent",
-            "Sensor",
-        ]:
-            continue
-        elif args.focus_security and node_type not in [
-            "Attack",
-            "Vulnerability",
-            "Mitigation",
-            "Event",
-            "Policy",
-        ]:
-            continue
-        elif args.focus_supply_chain and node_type not in [
-            "Supplier",
-            "SupplyChainRisk",
-        ]:
+        if allowed_types is not None and node_type not in allowed_types:
             continue
 
-        color = COLOR_SCHEME.get(node_type, DEFAULT_NODE_COLOR)
-        nxg.add_node(
-            label, color=color, node_type=node_type
-        )  # nxg uses labels as node IDs
+        # Labels are node IDs; a repeated label keeps its slot but takes the
+        # latest node type
+        node_id = id_of.setdefault(label, len(node_ids))
+        if node_id == len(node_ids):
+            node_ids.append(label)
+            node_types.append(node_type)
+        else:
+            node_types[node_id] = node_type
+        uri_to_label[node_uri] = label
 
     # Add subclass edges
     if not args.no_inheritance:
-        for s, _, o in g.triples((None, RDFS.subClassOf, None)):
-            if isinstance(s, BNode) or isinstance(o, BNode):
-                continue
-
-            s_label = get_label(s)
-            o_label = get_label(o)
-            # Check if subject and object labels correspond to nodes actually added to nxg
-            if s_label in nxg and o_label in nxg:
-                nxg.add_edge(s_label, o_label, label="subClassOf", style="dashed")
+        for s, o in index.subclass_pairs:
+            # Only link classes that were added as nodes (never BNodes)
+            s_label = uri_to_label.get(s)
+            o_label = uri_to_label.get(o)
+            if s_label is not None and o_label is not None:
+                edge_attrs[id_of[s_label], id_of[o_label]] = ("subClassOf", True)
 
     # Add object property domain → range edges
-    for prop in object_properties:
-        if isinstance(prop, BNode):
-            continue
-        prop_label = get_label(prop)
-
-        # Apply --no-common-properties filter if present and active
-        if (
-            hasattr(args, "no_common_properties")
-            and args.no_common_properties
-            and any(x in prop_label.lower() for x in ["ref", "type", "status"])
-        ):
-            continue
-
-        # Get all domains and ranges for this property
-        domain_uris = list(g.objects(prop, RDFS.domain))
-        range_uris = list(g.objects(prop, RDFS.range))
+    property_items = [
+        (prop, named_domains.get(prop, ()), named_ranges.get(prop, ()))
+        for prop in object_properties
+    ]
+    for prop_label, domain_labels, range_labels in label_properties(
+        property_items, skip_common_properties
+    ):
+        # Node IDs of the named domains and ranges for this property; those
+        # whose labels were not added as nodes are dropped up front
+        domain_ids = [id_of.get(label) for label in domain_labels]
+        range_ids = [id_of[label] for label in range_labels if label in id_of]
 
         # If no explicit domains/ranges, don't create an edge
-        if not domain_uris or not range_uris:
+        if not range_ids:
             continue
 
         # Create edges for all domain/range combinations
-        for domain_uri in domain_uris:
-            if isinstance(domain_uri, BNode):
+        for domain_id in domain_ids:
+            if domain_id is None:
                 continue
-
-            for range_uri in range_uris:
-                if isinstance(range_uri, BNode):
-                    continue
-
-                domain_label = get_label(domain_uri)
-                range_label = get_label(range_uri)
-
-                # Check if domain and range labels correspond to nodes actually added to nxg
-                if domain_label in nxg and range_label in nxg:
-                    nxg.add_edge(domain_label, range_label, label=prop_label)
+            for range_id in range_ids:
+                key = (domain_id, range_id)
+                previous = edge_attrs.get(key)
+                edge_attrs[key] = (prop_label, previous is not None and previous[1])
+
+    edge_ends = np.array(list(edge_attrs), dtype=np.intp).reshape(-1, 2)
+    edge_labels = [label for label, _ in edge_attrs.values()]
+    dashed = np.fromiter(
+        (is_dashed for _, is_dashed in edge_attrs.values()),
+        dtype=bool,
+        count=len(edge_attrs),
+    )
+    degrees = np.bincount(edge_ends.ravel(), minlength=len(node_ids))
 
     # Remove nodes with degree 0
-    zero_degree_nodes = [n for n, d in nxg.degree() if d == 0]
-    nxg.remove_nodes_from(zero_degree_nodes)
+    keep = degrees > 0
+
+    # Above --max-nodes, keep the high-priority node types and fill the rest of
+    # the budget with the best-connected remaining nodes
+    max_nodes = getattr(args, "max_nodes", None)
+    truncated = max_nodes is not None and int(keep.sum()) > max_nodes
+    if truncated:
+        priority = keep & np.array(
+            [node_type in PRIORITY_NODE_TYPES for node_type in node_types], dtype=bool
+        )
+        remaining = np.flatnonzero(keep & ~priority)
+        # Stable sort keeps insertion order among nodes of equal degree
+        remaining = remaining[np.argsort(-degrees[remaining], kind="stable")]
+        total = int(keep.sum())
+        keep = priority.copy()
+        keep[remaining[: max(0, max_nodes - int(priority.sum()))]] = True
+        print(f"Showing {int(keep.sum())} of {total} nodes (--max-nodes {max_nodes})")
+
+    # Renumber the surviving nodes and drop edges that lost an endpoint
+    new_id = np.cumsum(keep) - 1
+    kept_edges = keep[edge_ends].all(axis=1)
+    edge_ends = new_id[edge_ends[kept_edges]]
+    dashed = dashed[kept_edges]
+    edge_labels = [label for label, ok in zip(edge_labels, kept_edges) if ok]
+    node_ids = [node for node, ok in zip(node_ids, keep) if ok]
+    node_types = [node_type for node_type, ok in zip(node_types, keep) if ok]
+    degrees = np.bincount(edge_ends.ravel(), minlength=len(node_ids))
 
     # Build Plotly edge and node traces with improved layout for electrical grid visualization
 
@@ -329,128 +873,146 @@ def convert_to_plotly_html(
         "GridEvent",
         "grid_stix_2_1",
     ]
-    root_node = None
-    for candidate in root_candidates:
-        if candidate in nxg:
-            root_node = candidate
-            break
-
-    # Use user-specified layout for electrical grid visualization
-    try:
-        if args.layout == "spring":
-            pos = nx.spring_layout(nxg, k=3, iterations=50)
-        else:
-            layout_args = "-Granksep=3.0 -Gnodesep=2.0"
-            if root_node and args.layout in ["dot", "twopi"]:
-                layout_args += f" -Groot={root_node}"
-            pos = nx_agraph.graphviz_layout(nxg, prog=args.layout, args=layout_args)
-    except:
-        # Fallback to spring layout if graphviz fails
-        print(f"Warning: {args.layout} layout failed, falling back to spring layout")
-        pos = nx.spring_layout(nxg, k=3, iterations=50)
-
-    solid_edge_x, solid_edge_y = [], []
-    dashed_edge_x, dashed_edge_y = [], []
-
-    for u, v, d in nxg.edges(data=True):
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        if d.get("style") == "dashed":
-            dashed_edge_x.extend([x0, x1, None])
-            dashed_edge_y.extend([y0, y1, None])
-        else:
-            solid_edge_x.extend([x0, x1, None])
-            solid_edge_y.extend([y0, y1, None])
-
-    # Add invisible edge label markers for better hover
-    edge_label_x = []
-    edge_label_y = []
-    edge_label_text = []
-    for u, v, d in nxg.edges(data=True):
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_label_x.append((x0 + x1) / 2)
-        edge_label_y.append((y0 + y1) / 2)
-        edge_label_text.append(d.get("label", ""))
-
-    edge_label_trace = go.Scatter(
-        x=edge_label_x,
-        y=edge_label_y,
-        mode="markers",
-        marker=dict(size=2, color="#888"),
-        hoverinfo="text",
-        hovertext=edge_label_text,
-        showlegend=False,
-    )
-
-    degrees = dict(nxg.degree())
-    min_label_degree = 1
+    kept_ids = set(node_ids)
+    root_node = next((c for c in root_candidates if c in kept_ids), None)
 
-    # Group nodes by type
-    from collections import defaultdict
+    # NetworkX is only needed by the layout programs, so the graph is built
+    # for them here and discarded once positions are known
+    nxg = nx.DiGraph()
+    nxg.add_nodes_from(node_ids)
+    nxg.add_edges_from((node_ids[u], node_ids[v]) for u, v in edge_ends.tolist())
+
+    # Use user-specified layout for electrical grid visualization; large graphs
+    # default to sfdp since dot does not scale to thousands of nodes
+    base_layout = "sfdp" if len(nxg) > LARGE_GRAPH_NODES else "dot"
+    layout = getattr(args, "layout", None) or base_layout
+    collapse_leaves = getattr(args, "collapse_leaves", False)
+    if layout == "cached":
+        pos = cached_layout(nxg, base_layout, root_node, collapse_leaves)
+    else:
+        pos = compute_layout(nxg, layout, root_node, collapse_leaves)
 
-    node_groups = defaultdict(list)
-    for node, data in nxg.nodes(data=True):
-        node_groups[data.get("node_type", "Other")].append(node)
+    # Node positions as arrays indexed by node number, so edge endpoints and
+    # midpoints are gathered with array indexing instead of per-edge Python math
+    node_x = np.fromiter(
+        (pos[node][0] for node in node_ids), dtype=np.float64, count=len(node_ids)
+    )
+    node_y = np.fromiter(
+        (pos[node][1] for node in node_ids), dtype=np.float64, count=len(node_ids)
+    )
+
+    x0, x1 = node_x[edge_ends[:, 0]], node_x[edge_ends[:, 1]]
+    y0, y1 = node_y[edge_ends[:, 0]], node_y[edge_ends[:, 1]]
+
+    solid_edge_x = interleave_segments(x0[~dashed], x1[~dashed])
+    solid_edge_y = interleave_segments(y0[~dashed], y1[~dashed])
+    dashed_edge_x = interleave_segments(x0[dashed], x1[dashed])
+    dashed_edge_y = interleave_segments(y0[dashed], y1[dashed])
+
+    edge_label_threshold = getattr(args, "edge_label_threshold", EDGE_LABEL_THRESHOLD)
+    large_graph = len(edge_ends) > edge_label_threshold
+    # Traces are plain dicts in Plotly's JSON schema; "scattergl" draws with WebGL
+    use_webgl = getattr(args, "webgl", False) or (
+        len(node_ids) + len(edge_ends) > WEBGL_THRESHOLD
+    )
+    scatter = "scattergl" if use_webgl else "scatter"
+    edge_scatter = "scattergl" if large_graph else scatter
+
+    # Add invisible edge label markers for better hover. Points whose label
+    # repeats often share one trace with a single hover string, so labels such
+    # as "subClassOf" are stored once rather than per edge.
+    edge_label_traces = []
+    if not large_graph:
+        label_x, label_y = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+        label_table, label_ids, label_counts = np.unique(
+            np.array(edge_labels, dtype=str),
+            return_inverse=True,
+            return_counts=True,
+        )
+        shared = label_counts[label_ids] >= SHARED_EDGE_LABEL_MIN
+        marker_groups = [
+            (label_ids == label_id, str(label_table[label_id]))
+            for label_id in np.flatnonzero(label_counts >= SHARED_EDGE_LABEL_MIN)
+        ]
+        marker_groups.append((~shared, label_table[label_ids[~shared]].tolist()))
+        for mask, hovertext in marker_groups:
+            if not mask.any():
+                continue
+            edge_label_traces.append(
+                dict(
+                    type=scatter,
+                    x=label_x[mask],
+                    y=label_y[mask],
+                    mode="markers",
+                    marker=dict(size=2, color="#888"),
+                    hoverinfo="text",
+                    hovertext=hovertext,
+                    showlegend=False,
+                )
+            )
+
+    min_label_degree = 1
+
+    # Nodes are grouped by type code with np.unique; types are visited in
+    # order of first appearance so the legend order follows the ontology.
+    # Per-type coordinates, degrees and styling are gathered in bulk.
+    unique_types, first_seen, type_codes = np.unique(
+        np.array(node_types, dtype=str), return_index=True, return_inverse=True
+    )
 
     node_traces = []
-    for node_type, nodes in node_groups.items():
-        xs, ys, texts, hovertexts, colors, sizes, fonts = [], [], [], [], [], [], []
-        for node in nodes:
-            x, y = pos[node]
-            deg = degrees[node]
-            xs.append(x)
-            ys.append(y)
-            if deg >= min_label_degree:
-                texts.append(f"{node}")
-                fonts.append(min(24, max(8, 8 + deg * 2)))
-            else:
-                texts.append("")
-                fonts.append(10)
-            # Enhanced hover text with Grid-STIX context
-            hover_info = f"<b>{node}</b><br>"
-            hover_info += f"Type: {node_type}<br>"
-            hover_info += f"Connections: {deg}<br>"
-
-            # Add Grid-STIX specific context
-            if node_type == "OTDevice":
-                hover_info += "Category: Operational Technology<br>"
-            elif node_type == "GridComponent":
-                hover_info += "Category: Electrical Grid Equipment<br>"
-            elif node_type == "Supplier":
-                hover_info += "Category: Supply Chain Entity<br>"
-            elif node_type == "Attack":
-                hover_info += "Category: Threat Pattern<br>"
-            elif node_type == "Protection":
-                hover_info += "Category: Protective System<br>"
-            elif node_type == "PowerFlow":
-                hover_info += "Category: Electrical Flow<br>"
-            elif node_type == "Protocol":
-                hover_info += "Category: Communication Protocol<br>"
-
-            hovertexts.append(hover_info)
-            colors.append(COLOR_SCHEME.get(node_type, DEFAULT_NODE_COLOR))
-            sizes.append(10 + deg)
+    for code in np.argsort(first_seen):
+        node_type = str(unique_types[code])
+        idx = np.flatnonzero(type_codes == code)
+        degs = degrees[idx]
+        labelled = degs >= min_label_degree
+        names = [node_ids[i] for i in idx.tolist()]
+
+        # Enhanced hover text with Grid-STIX context; the parts shared by the
+        # whole trace live in the template and only name and degree per node
+        category = NODE_CATEGORIES.get(node_type)
+        hovertemplate = (
+            "<b>%{customdata[0]}</b><br>"
+            f"Type: {node_type}<br>"
+            "Connections: %{customdata[1]}<br>"
+            + (f"Category: {category}<br>" if category else "")
+            + "<extra></extra>"
+        )
+
         node_traces.append(
-            go.Scatter(
-                x=xs,
-                y=ys,
+            dict(
+                type=scatter,
+                x=node_x[idx],
+                y=node_y[idx],
                 mode="markers+text",
-                text=texts,
-                hovertext=hovertexts,
-                hoverinfo="text",
+                text=[name if show else "" for name, show in zip(names, labelled)],
+                customdata=list(zip(names, degs.tolist())),
+                hovertemplate=hovertemplate,
                 textposition="top center",
-                marker=dict(showscale=False, size=sizes, color=colors, line_width=1),
-                textfont=dict(size=fonts),
+                marker=dict(
+                    showscale=False,
+                    size=10 + degs,
+                    color=COLOR_SCHEME.get(node_type, DEFAULT_NODE_COLOR),
+                    line=dict(width=1),
+                ),
+                textfont=dict(
+                    size=np.where(labelled, np.clip(8 + degs * 2, 8, 24), 10)
+                ),
                 name=node_type,
                 legendgroup=node_type,
                 showlegend=True,
+                visible=(
+                    "legendonly"
+                    if truncated and node_type not in PRIORITY_NODE_TYPES
+                    else True
+                ),
             )
         )
 
     edge_traces = []
-    if solid_edge_x:
-        solid_edge_trace = go.Scatter(
+    if solid_edge_x.size:
+        solid_edge_trace = dict(
+            type=edge_scatter,
             x=solid_edge_x,
             y=solid_edge_y,
             line=dict(width=1, color="#888"),
@@ -460,8 +1022,9 @@ def convert_to_plotly_html(
         )
         edge_traces.append(solid_edge_trace)
 
-    if dashed_edge_x:
-        dashed_edge_trace = go.Scatter(
+    if dashed_edge_x.size:
+        dashed_edge_trace = dict(
+            type=edge_scatter,
             x=dashed_edge_x,
             y=dashed_edge_y,
             line=dict(width=1, color="#888", dash="dash"),  # Apply dash style
@@ -473,12 +1036,12 @@ def convert_to_plotly_html(
         edge_traces.append(dashed_edge_trace)
 
     # Create comprehensive title and annotations for Grid-STIX
-    title_text = "Grid-STIX 2.1 Electrical Grid Cybersecurity Ontology"
+    title_text = GRAPH_TITLE
     subtitle = "Interactive visualization of grid assets, threats, and relationships"
 
-    fig = go.Figure(
-        data=edge_traces + [edge_label_trace] + node_traces,
-        layout=go.Layout(
+    figure = dict(
+        data=edge_traces + edge_label_traces + node_traces,
+        layout=dict(
             title={
                 "text": f"<b>{title_text}</b><br><sub>{subtitle}</sub>",
                 "font": {"size": 20},
@@ -519,7 +1082,12 @@ def convert_to_plotly_html(
         ),
     )
 
-    fig.write_html(output_path)
+    write_html(
+        figure,
+        output_path,
+        plotlyjs=getattr(args, "plotlyjs", "cdn"),
+        full_html=not getattr(args, "div_only", False),
+    )
     print(f"Plotly HTML graph written to: {output_path}")
 
 
@@ -580,9 +1148,49 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--layout",
-        choices=["dot", "twopi", "neato", "circo", "spring"],
-        default="dot",
-        help="Graph layout algorithm (default: dot)",
+        choices=["dot", "twopi", "neato", "circo", "sfdp", "spring", "cached"],
+        help="Graph layout algorithm (default: dot, or sfdp above "
+        f"{LARGE_GRAPH_NODES} nodes); 'cached' reuses positions saved in "
+        f"{LAYOUT_CACHE_DIR} for an identical graph",
+    )
+    parser.add_argument(
+        "--max-nodes",
+        type=int,
+        help="Limit the graph to this many nodes, keeping priority types "
+        "(assets, events, components, attacks, vulnerabilities) and then the "
+        "best-connected others, which start hidden in the legend",
+    )
+    parser.add_argument(
+        "--plotlyjs",
+        choices=["cdn", "inline", "directory"],
+        default="cdn",
+        help="How the page loads plotly.js: from the Plotly CDN (default), "
+        "embedded in the HTML, or from a plotly.min.js written next to it",
+    )
+    parser.add_argument(
+        "--div-only",
+        action="store_true",
+        help="Write only the graph div and its scripts, for embedding in "
+        "another page",
+    )
+    parser.add_argument(
+        "--collapse-leaves",
+        action="store_true",
+        help="Lay out graphs without their degree-1 nodes, then place each "
+        "around its neighbour",
+    )
+    parser.add_argument(
+        "--edge-label-threshold",
+        type=int,
+        default=EDGE_LABEL_THRESHOLD,
+        help="Skip edge label hover markers and render edges with WebGL above "
+        f"this many edges (default: {EDGE_LABEL_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--webgl",
+        action="store_true",
+        help="Draw every trace with WebGL, which is otherwise used above "
+        f"{WEBGL_THRESHOLD} nodes plus edges",
     )
 
     args = parser.parse_args()
@@ -9,19 +9,32 @@ import sys
 import py_compile
 import importlib.util
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import tempfile
 import subprocess  # nosec B404 - needed for validation, uses safe subprocess.run() patterns
 
+# Directories that never contain generated sources; pruned during discovery
+SKIP_DIRS = {"__pycache__", ".mypy_cache", ".pytest_cache"}
+
+
+def iter_python_files(directory: Path) -> Iterator[Path]:
+    """Lazily yield Python files below directory, skipping cache and hidden dirs."""
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                # DirEntry type checks use cached dirent data, avoiding extra stat calls
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                    yield Path(entry.path)
+
 
 def find_python_files(directory: Path) -> List[Path]:
     """Find all Python files in the given directory recursively."""
-    python_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".py") and file != "__init__.py":
-                python_files.append(Path(root) / file)
-    return python_files
+    return list(iter_python_files(directory))
 
 
 def test_syntax(file_path: Path) -> bool:
@@ -133,27 +146,32 @@ def main():
         relative_path = file_path.relative_to(python_dir.parent)
         print(f"\n📝 Testing {relative_path}")
 
+        # Collect per-file results and emit them with a single write
+        results = []
+
         # Test syntax
         if test_syntax(file_path):
-            print(f"  ✅ Syntax: PASS")
+            results.append("  ✅ Syntax: PASS")
             syntax_pass += 1
         else:
-            print(f"  ❌ Syntax: FAIL")
+            results.append("  ❌ Syntax: FAIL")
 
         # Test imports (only if syntax passes)
         if syntax_pass > 0:
             if test_imports(file_path):
-                print(f"  ✅ Imports: PASS")
+                results.append("  ✅ Imports: PASS")
                 import_pass += 1
             else:
-                print(f"  ❌ Imports: FAIL")
+                results.append("  ❌ Imports: FAIL")
 
         # Test class structure
         if validate_class_structure(file_path):
-            print(f"  ✅ Structure: PASS")
+            results.append("  ✅ Structure: PASS")
             structure_pass += 1
         else:
-            print(f"  ❌ Structure: FAIL")
+            results.append("  ❌ Structure: FAIL")
+
+        print("\n".join(results))
 
     # Print summary
     print("\n" + "=" * 50)
@@ -48,6 +48,31 @@ class TestPythonValidator:
             finally:
                 sys.path.remove(str(Path(__file__).parent.parent / "src"))
 
+    def test_find_python_files_skips_cache_dirs(self):
+        """Test that cache and hidden directories are not scanned."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_dir = Path(temp_dir)
+
+            (test_dir / "module.py").touch()
+            (test_dir / "__pycache__").mkdir()
+            (test_dir / "__pycache__" / "cached.py").touch()
+            (test_dir / ".hidden").mkdir()
+            (test_dir / ".hidden" / "hidden.py").touch()
+
+            import sys
+
+            sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+            try:
+                from validate_python import find_python_files
+
+                result = find_python_files(test_dir)
+
+                assert [f.name for f in result] == ["module.py"]
+
+            finally:
+                sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
     def test_test_syntax_valid_file(self):
         """Test syntax validation with valid Python file."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -361,6 +386,88 @@ class TestOntologyChecker:
         finally:
             sys.path.remove(str(Path(__file__).parent.parent / "src"))
 
+    def test_find_isolated_classes(self):
+        """Test that a bare owl:Class declaration does not count as a connection."""
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+        try:
+            import ontology_checker
+            from rdflib import Graph, OWL, RDF, RDFS, URIRef
+
+            base = ontology_checker.BASE_NAMESPACE
+            isolated = URIRef(base + "test#isolated-class")
+            child = URIRef(base + "test#child-class")
+            parent = URIRef(base + "test#parent-class")
+
+            graph = Graph()
+            for cls in (isolated, child, parent):
+                graph.add((cls, RDF.type, OWL.Class))
+            graph.add((child, RDFS.subClassOf, parent))
+
+            assert ontology_checker.find_isolated_classes(graph) == [str(isolated)]
+
+        finally:
+            sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
+    def test_run_checks_skips_named_checks(self):
+        """Test that run_checks reports every result key and honours skips."""
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+        try:
+            import ontology_checker
+            from rdflib import Graph, OWL, RDF, URIRef
+
+            prop = URIRef(ontology_checker.BASE_NAMESPACE + "test#has-part")
+            graph = Graph()
+            graph.add((prop, RDF.type, OWL.ObjectProperty))
+
+            results = ontology_checker.run_checks(graph)
+            assert results["missing_domain"] == [str(prop)]
+            assert results["missing_range"] == [str(prop)]
+            assert "class_uri_violations" in results
+
+            skipped = ontology_checker.run_checks(graph, skip=["missing_domain_range"])
+            assert skipped["missing_domain"] == []
+            assert skipped["missing_range"] == []
+            assert set(skipped) == set(results)
+
+        finally:
+            sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
+    def test_checks_see_current_graph_contents(self):
+        """Test that checks never reuse results from another or older graph."""
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+        try:
+            import ontology_checker
+            from rdflib import Graph, Literal, RDFS, URIRef
+
+            subject = URIRef(ontology_checker.BASE_NAMESPACE + "test#widget")
+            first = Graph(identifier=URIRef("urn:x"))
+            first.add((subject, RDFS.label, Literal("bad name!")))
+            assert ontology_checker.check_invalid_technical_names(first) == [
+                f"{subject} -> 'bad name!'"
+            ]
+
+            # Graphs with the same identifier compare equal in rdflib
+            second = Graph(identifier=URIRef("urn:x"))
+            second.add((subject, RDFS.label, Literal("widget")))
+            assert ontology_checker.check_invalid_technical_names(second) == []
+
+            # Replacing a triple leaves the graph size unchanged
+            first.remove((subject, RDFS.label, Literal("bad name!")))
+            first.add((subject, RDFS.label, Literal("widget")))
+            assert ontology_checker.check_invalid_technical_names(first) == []
+
+        finally:
+            sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
 
 class TestOwlToHtml:
     """Test cases for OWL to HTML conversion utility."""
@@ -387,6 +494,186 @@ class TestOwlToHtml:
             if str(Path(__file__).parent.parent / "src") in sys.path:
                 sys.path.remove(str(Path(__file__).parent.parent / "src"))
 
+    def test_get_node_type_keyword_priority(self):
+        """Test that label keywords resolve in priority order, then via ancestors."""
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+        try:
+            import owl_to_html
+            from rdflib import Graph, RDFS, URIRef
+
+            base = owl_to_html.GRID_BASE + "test#"
+            graph = Graph()
+            graph.add(
+                (URIRef(base + "widget"), RDFS.subClassOf, URIRef(base + "Asset"))
+            )
+            graph.add(
+                (URIRef(base + "sprocket"), RDFS.subClassOf, URIRef(base + "widget"))
+            )
+            inherited = owl_to_html.build_inherited_types(graph)
+
+            def node_type(name: str) -> str:
+                return owl_to_html.get_node_type(
+                    name.lower(), URIRef(base + name), inherited
+                )
+
+            # "sensor" outranks "asset" regardless of position in the label
+            assert node_type("asset_sensor") == "Sensor"
+            assert node_type("supplier_risk") == "SupplyChainRisk"
+            assert node_type("attack_mitigation") == "Mitigation"
+            assert node_type("widget") == "Asset"
+            # Types are inherited from the nearest typed ancestor
+            assert node_type("sprocket") == "Asset"
+            assert node_type("gadget") == "Other"
+
+            # rdflib terms are classified without a str() copy, despite
+            # overriding startswith with a version that rejects tuples
+            assert owl_to_html.namespace_of(URIRef(base + "widget")) == "Grid"
+            stix_uri = URIRef(owl_to_html.STIX_BASE + "#indicator")
+            assert owl_to_html.namespace_of(stix_uri) == "STIX"
+            assert owl_to_html.is_stix(stix_uri) and owl_to_html.is_cti(stix_uri)
+
+        except ImportError:
+            pytest.skip("owl_to_html module dependencies not available")
+
+        finally:
+            if str(Path(__file__).parent.parent / "src") in sys.path:
+                sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
+    def test_cached_layout_reuses_saved_positions(self):
+        """Test that a cached layout is computed once and reloaded from disk."""
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+        try:
+            import networkx as nx
+            import owl_to_html
+
+            graph = nx.DiGraph([("Asset", "Sensor"), ("Sensor", "Relay")])
+            positions = {"Asset": (0.0, 1.0), "Sensor": (2.0, 3.0), "Relay": (4.0, 5.0)}
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                with (
+                    patch.object(owl_to_html, "LAYOUT_CACHE_DIR", temp_dir),
+                    patch.object(
+                        owl_to_html, "compute_layout", return_value=positions
+                    ) as compute,
+                ):
+                    first = owl_to_html.cached_layout(graph, "dot")
+                    second = owl_to_html.cached_layout(graph, "dot")
+
+                    assert compute.call_count == 1
+                    assert first == positions
+                    assert second == positions
+                    assert len(list(Path(temp_dir).glob("layout-*.npz"))) == 1
+
+        except ImportError:
+            pytest.skip("owl_to_html module dependencies not available")
+
+        finally:
+            if str(Path(__file__).parent.parent / "src") in sys.path:
+                sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
+    def test_compute_layout_packs_components_and_places_leaves(self):
+        """Test that components are laid out apart and leaves ring their parent."""
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+        try:
+            import math
+
+            import networkx as nx
+            import owl_to_html
+
+            graph = nx.DiGraph(
+                [("Hub", "A"), ("Hub", "B"), ("Hub", "C"), ("A", "B"), ("X", "Y")]
+            )
+            pos = owl_to_html.compute_layout(graph, "spring", collapse_leaves=True)
+
+            assert set(pos) == set(graph)
+
+            # "C" is a leaf placed half the median core edge length from "Hub"
+            def dist(u, v):
+                return math.hypot(pos[u][0] - pos[v][0], pos[u][1] - pos[v][1])
+
+            core_edges = [("Hub", "A"), ("Hub", "B"), ("A", "B")]
+            median = sorted(dist(u, v) for u, v in core_edges)[1]
+            assert dist("Hub", "C") == pytest.approx(0.5 * median)
+            # The two-node component is packed clear of the larger one
+            main_xs = [pos[n][0] for n in ("Hub", "A", "B", "C")]
+            assert min(pos["X"][0], pos["Y"][0]) > max(main_xs) or min(
+                pos["X"][1], pos["Y"][1]
+            ) < min(pos[n][1] for n in ("Hub", "A", "B", "C"))
+            # ...and stacked directly, source above target, one rank apart
+            assert pos["X"][0] == pos["Y"][0]
+            assert pos["X"][1] - pos["Y"][1] == pytest.approx(
+                owl_to_html.RANK_SPACING["spring"]
+            )
+
+        except ImportError:
+            pytest.skip("owl_to_html module dependencies not available")
+
+        finally:
+            if str(Path(__file__).parent.parent / "src") in sys.path:
+                sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
+    def test_write_html_embeds_escaped_figure_json(self):
+        """Test that the HTML page loads plotly.js and escapes script-closing text."""
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+        try:
+            import numpy as np
+            import owl_to_html
+
+            figure = {
+                "data": [
+                    {
+                        "type": "scatter",
+                        "x": np.array([0.0, 1.0, np.nan]),
+                        "y": np.array([0.0, 1.0, np.nan]),
+                        "text": ["</script><b>x</b>"],
+                    }
+                ],
+                "layout": {"title": {"text": "Test"}},
+            }
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output = Path(temp_dir) / "graph.html"
+                owl_to_html.write_html(figure, str(output))
+                html = output.read_text(encoding="utf-8")
+
+            assert 'src="https://cdn.plot.ly/plotly-' in html
+            # Line breaks are NaN, or null when orjson is installed
+            assert "[0.0,1.0,NaN]" in html or "[0.0,1.0,null]" in html
+            assert "<\\/script><b>x<\\/b>" in html
+            assert html.count("</script>") == 2
+
+            # A div-only fragment referencing a plotly.min.js written alongside
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output = Path(temp_dir) / "graph.html"
+                owl_to_html.write_html(
+                    figure, str(output), plotlyjs="directory", full_html=False
+                )
+                fragment = output.read_text(encoding="utf-8")
+                assert (Path(temp_dir) / "plotly.min.js").exists()
+
+            assert 'src="plotly.min.js"' in fragment
+            assert "<html>" not in fragment
+            assert 'id="grid-stix-graph"' in fragment
+
+        except ImportError:
+            pytest.skip("owl_to_html module dependencies not available")
+
+        finally:
+            if str(Path(__file__).parent.parent / "src") in sys.path:
+                sys.path.remove(str(Path(__file__).parent.parent / "src"))
+
 
 class TestUtilityIntegration:
     """Integration tests for utility modules working together."""